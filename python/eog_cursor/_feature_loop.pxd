@@ -0,0 +1,18 @@
+# Cython declarations for _feature_loop.py (pure-Python mode).
+#
+# Only read by `EOG_CURSOR_COMPILE=1 pip install .` (see setup.py): the
+# window is a read-only contiguous double memoryview and every loop
+# variable is a C scalar, so both passes compile to plain C loops.
+# Bounds/wraparound checks are switched off by the directive comment at
+# the top of _feature_loop.py: callers guarantee at least one sample.
+
+cimport cython
+
+@cython.locals(n=Py_ssize_t, i=Py_ssize_t, crossings=Py_ssize_t,
+               sign=int, prev_sign=int,
+               x=double, d=double, c=double, c2=double, dd=double,
+               total=double, lo=double, hi=double, max_deriv=double,
+               mean=double, half=double, d_mean=double,
+               m2=double, m3=double, m4=double, ramp_dot=double, d_var=double,
+               var=double, std=double, skewness=double, kurtosis=double)
+cpdef window_features(const double[::1] w, double[:] out, Py_ssize_t offset)
@@ -0,0 +1,98 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+Loop form of extract_features() for the optional compiled build.
+
+window_features() computes the same ten features as
+feature_extraction.extract_features() with explicit loops over the
+samples.  Interpreted, that is far slower than the NumPy version, so
+feature_extraction only switches to it when this module has been compiled
+by Cython (`EOG_CURSOR_COMPILE=1`, see setup.py): _feature_loop.pxd types
+the loops, which then run as plain C over the window's memory with no
+per-call NumPy dispatch.
+"""
+
+import math
+
+try:
+    import cython
+    COMPILED = cython.compiled
+except ImportError:
+    COMPILED = False
+
+
+def window_features(w, out, offset):
+    """
+    Write the features of window `w` into out[offset:offset + 10].
+
+    Same order as FEATURE_NAMES.  Two passes over the samples: the first
+    finds the mean, range and largest step; the second takes the centered
+    moments (raw power sums of ~2000-count samples would cancel
+    catastrophically), sign changes, slope and derivative variance.
+    `w` must hold at least one sample.
+    """
+    n = w.shape[0]
+
+    total = 0.0
+    lo = w[0]
+    hi = w[0]
+    max_deriv = 0.0
+    for i in range(n):
+        x = w[i]
+        total += x
+        if x < lo:
+            lo = x
+        if x > hi:
+            hi = x
+        if i > 0:
+            d = x - w[i - 1]
+            if d < 0:
+                d = -d
+            if d > max_deriv:
+                max_deriv = d
+    mean = total / n
+
+    # Mean step telescopes to (last - first) / (n - 1)
+    half = (n - 1) / 2.0
+    d_mean = (w[n - 1] - w[0]) / (n - 1) if n > 1 else 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    ramp_dot = 0.0
+    d_var = 0.0
+    crossings = 0
+    prev_sign = 0
+    for i in range(n):
+        x = w[i]
+        c = x - mean
+        c2 = c * c
+        m2 += c2
+        m3 += c2 * c
+        m4 += c2 * c2
+        ramp_dot += (i - half) * x
+        sign = 1 if c > 0 else (-1 if c < 0 else 0)
+        if i > 0:
+            if sign != prev_sign:
+                crossings += 1
+            dd = x - w[i - 1] - d_mean
+            d_var += dd * dd
+        prev_sign = sign
+
+    var = m2 / n
+    std = math.sqrt(var)
+    if std > 0:
+        skewness = m3 / n / (var * std)
+        kurtosis = m4 / n / (var * var) - 3
+    else:
+        skewness = 0.0
+        kurtosis = 0.0
+
+    out[offset] = hi - lo
+    out[offset + 1] = crossings
+    out[offset + 2] = ramp_dot * 12.0 / (n * (n * n - 1.0)) if n > 1 else 0.0
+    out[offset + 3] = max_deriv
+    out[offset + 4] = mean
+    out[offset + 5] = std
+    out[offset + 6] = skewness
+    out[offset + 7] = kurtosis
+    out[offset + 8] = math.sqrt(var + mean * mean)
+    out[offset + 9] = d_var / (n - 1) if n > 1 else 0.0
@@ -46,6 +46,7 @@ KALMAN_R = 500.0           # Measurement noise (gyro sensor noise variance)
 
 # --- Cursor Movement (IMU) ---
 CURSOR_SENSITIVITY = 0.01     # Gyro-to-pixel scaling factor
+CURSOR_FLUSH_INTERVAL = 1.0 / 60  # seconds - coalesce moves into ~60 OS calls/s
 
 # --- Cursor Control (State-Space Model) ---
 SS_VELOCITY_RETAIN = 0.92     # Velocity retention per step (0.8=quick stop, 0.99=long glide)
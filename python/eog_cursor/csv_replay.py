@@ -7,11 +7,18 @@ the data were streaming from the STM32 in real time.
 Supports two modes:
   - Real-time: Plays back at the original sample rate (200Hz)
   - Fast: Replays as fast as possible (for batch processing)
+
+Parsed recordings are cached next to the CSV as ``<csv>.npy`` and
+memory-mapped on later runs.  read_recording_csv() is the typed CSV
+parser shared with the training script.
 """
 
+import os
+import tempfile
 import time
 import logging
 
+import numpy as np
 import pandas as pd
 
 from . import config
@@ -19,6 +26,47 @@ from .serial_reader import SensorPacket
 
 logger = logging.getLogger(__name__)
 
+# On-disk layout of the memory-mapped replay cache (<csv>.npy)
+_CACHE_DTYPE = np.dtype([
+    ('timestamp', 'i8'),
+    ('eog_v', 'i2'),
+    ('eog_h', 'i2'),
+    ('gyro_x', 'i2'),
+    ('gyro_y', 'i2'),
+    ('gyro_z', 'i2'),
+])
+
+# Parse-time dtypes: sensor channels need at most 16 bits, but the C parser
+# wraps out-of-range values silently, so parse to int32 (half the default
+# int64) and let load() range-check before narrowing to the int16 cache.
+_CSV_DTYPES = {
+    'timestamp': 'int64',
+    'eog': 'int32',
+    'eog_v': 'int32',
+    'eog_h': 'int32',
+    'gyro_x': 'int32',
+    'gyro_y': 'int32',
+    'gyro_z': 'int32',
+}
+
+
+def read_recording_csv(path: str) -> pd.DataFrame:
+    """
+    Parse a recording, using pandas' multithreaded pyarrow engine when available.
+
+    pyarrow is optional, and its engine rejects some files the C parser
+    accepts (e.g. dtype hints for columns a file lacks).  If the engine is
+    missing or fails, the C parser is used instead and raises any genuine
+    error itself.
+    """
+    try:
+        return pd.read_csv(path, dtype=_CSV_DTYPES, engine="pyarrow")
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.debug(f"pyarrow CSV engine failed on {path} ({e}), using the C parser")
+    return pd.read_csv(path, dtype=_CSV_DTYPES)
+
 
 class CSVReplaySource:
     """
@@ -42,9 +90,40 @@ class CSVReplaySource:
         self.loop = loop
         self.data = None
 
+        # Contiguous per-column arrays (filled by load()); stream() reads
+        # scalars from these instead of building a pandas Series per row.
+        self._n = 0
+        self._ts = None
+        self._ev = None
+        self._eh = None
+        self._gx = None
+        self._gy = None
+        self._gz = None
+
     def load(self):
-        """Load the CSV file into memory."""
-        self.data = pd.read_csv(self.csv_path)
+        """
+        Load the recording into memory.
+
+        The first load parses the CSV and writes a sibling ``<csv>.npy``
+        cache; later loads memory-map that cache instead of re-parsing,
+        as long as it is newer than the CSV.  A cache that cannot be read
+        back (e.g. truncated) is ignored and rebuilt from the CSV.
+        """
+        cache_path = self.csv_path + ".npy"
+        if self._cache_is_fresh(cache_path):
+            try:
+                cached = np.load(cache_path, mmap_mode='r')
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable replay cache {cache_path}: {e}")
+            else:
+                if cached.dtype == _CACHE_DTYPE:
+                    self._set_columns(cached)
+                    logger.info(f"Loaded {self._n} samples from {cache_path} (cached)")
+                    return
+                logger.warning(f"Ignoring replay cache {cache_path} with "
+                               f"unexpected layout {cached.dtype}")
+
+        self.data = read_recording_csv(self.csv_path)
 
         # Backward compatibility: rename legacy 'eog' column to 'eog_v'
         if 'eog' in self.data.columns and 'eog_v' not in self.data.columns:
@@ -60,58 +139,145 @@ class CSVReplaySource:
         if 'timestamp' not in self.data.columns:
             self.data['timestamp'] = range(0, len(self.data) * 5, 5)
 
+        columns = {name: self.data[name].to_numpy()
+                   for name in _CACHE_DTYPE.names}
+
+        # Sensor channels are 12-bit ADC / 16-bit gyro on hardware; only
+        # cache when the int16 layout holds every value exactly.
+        int16 = np.iinfo(np.int16)
+        if all(columns[name].size == 0 or
+               (columns[name].min() >= int16.min and columns[name].max() <= int16.max)
+               for name in _CACHE_DTYPE.names[1:]):
+            arr = np.empty(len(self.data), dtype=_CACHE_DTYPE)
+            for name, values in columns.items():
+                arr[name] = values
+            self._set_columns(arr)
+            self._write_cache(cache_path, arr)
+        else:
+            logger.debug("Sensor values exceed int16 range, skipping replay cache")
+            self._n = len(self.data)
+            self._ts = columns['timestamp']
+            self._ev = columns['eog_v']
+            self._eh = columns['eog_h']
+            self._gx = columns['gyro_x']
+            self._gy = columns['gyro_y']
+            self._gz = columns['gyro_z']
+
         logger.info(f"Loaded {len(self.data)} samples from {self.csv_path}")
 
         if 'label' in self.data.columns:
             counts = self.data['label'].value_counts()
             logger.info(f"Labels: {dict(counts)}")
 
+    @staticmethod
+    def _write_cache(cache_path: str, arr: np.ndarray):
+        """
+        Save the cache via a temp file in the same directory and rename it
+        into place, so an interrupted run never leaves a partial cache.
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(cache_path) or ".",
+                prefix=os.path.basename(cache_path) + ".", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, arr)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write replay cache {cache_path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _cache_is_fresh(self, cache_path: str) -> bool:
+        """True if the .npy cache exists and is at least as new as the CSV."""
+        try:
+            return os.path.getmtime(cache_path) >= os.path.getmtime(self.csv_path)
+        except OSError:
+            return False
+
+    def _set_columns(self, arr: np.ndarray):
+        """Point the per-column arrays at fields of a cache-layout array."""
+        self._n = arr.shape[0]
+        self._ts = arr['timestamp']
+        self._ev = arr['eog_v']
+        self._eh = arr['eog_h']
+        self._gx = arr['gyro_x']
+        self._gy = arr['gyro_y']
+        self._gz = arr['gyro_z']
+
     def stream(self):
         """
         Generator that yields SensorPackets from the CSV data.
 
         If realtime=True, sleeps between samples to match 200Hz rate.
+        Pacing uses absolute perf_counter() deadlines (monotonic, no drift
+        from sleep overshoot). pc_time is the replay start time plus the
+        sample's offset in the recording's own timestamps, so event timing
+        downstream depends only on the data and costs no clock read.  When
+        looping, each pass continues one sample period after the previous
+        pass's last pc_time, so pc_time never goes backwards.
         """
-        if self.data is None:
+        if self._ts is None:
             self.load()
 
+        period = config.SAMPLE_PERIOD
+        clock_start = time.monotonic()
         while True:
-            start_time = time.time()
-
-            for sample_num, (_, row) in enumerate(self.data.iterrows()):
-                packet = SensorPacket(
-                    timestamp=int(row['timestamp']),
-                    eog_v=int(row['eog_v']),
-                    eog_h=int(row['eog_h']),
-                    gyro_x=int(row['gyro_x']),
-                    gyro_y=int(row['gyro_y']),
-                    gyro_z=int(row['gyro_z']),
-                    pc_time=time.time()
+            start = time.perf_counter()
+            ts0 = int(self._ts[0]) if self._n else 0
+            pc_time = clock_start - period
+
+            for sample_num in range(self._n):
+                ts = int(self._ts[sample_num])
+                pc_time = clock_start + (ts - ts0) / 1000.0
+                # Positional construction: (timestamp, eog_v, eog_h, gx, gy, gz, pc_time)
+                yield SensorPacket(
+                    ts,
+                    int(self._ev[sample_num]),
+                    int(self._eh[sample_num]),
+                    int(self._gx[sample_num]),
+                    int(self._gy[sample_num]),
+                    int(self._gz[sample_num]),
+                    pc_time,
                 )
-                yield packet
 
                 if self.realtime:
-                    # Calculate expected time for next sample
-                    expected_time = start_time + (sample_num + 1) * config.SAMPLE_PERIOD
-                    sleep_time = expected_time - time.time()
+                    # Sleep until the next sample's deadline
+                    deadline = start + (sample_num + 1) * period
+                    sleep_time = deadline - time.perf_counter()
                     if sleep_time > 0:
                         time.sleep(sleep_time)
 
             if not self.loop:
                 break
 
+            clock_start = pc_time + period
             logger.info("Replay loop: restarting from beginning")
 
+    def stream_batch(self) -> dict[str, np.ndarray]:
+        """
+        Return the whole recording as column arrays (struct-of-arrays).
+
+        Offline consumers use this instead of stream() to skip per-sample
+        SensorPacket construction. Keys match the CSV column names.
+        """
+        if self._ts is None:
+            self.load()
+        return {
+            'timestamp': self._ts,
+            'eog_v': self._ev,
+            'eog_h': self._eh,
+            'gyro_x': self._gx,
+            'gyro_y': self._gy,
+            'gyro_z': self._gz,
+        }
+
     @property
     def duration_seconds(self) -> float:
         """Total duration of the recording in seconds."""
-        if self.data is not None:
-            return len(self.data) / config.SAMPLE_RATE
-        return 0.0
+        return self._n / config.SAMPLE_RATE
 
     @property
     def num_samples(self) -> int:
         """Total number of samples."""
-        if self.data is not None:
-            return len(self.data)
-        return 0
+        return self._n
@@ -17,6 +17,10 @@ Two controller variants:
   2. StateSpaceController - Physics-based cursor motion with inertia
 """
 
+import collections
+import os
+import sys
+import threading
 import time
 import logging
 
@@ -30,27 +34,177 @@ from .event_detector import (
 
 logger = logging.getLogger(__name__)
 
+# Enum members bound as globals for the per-sample path (compared with `is`)
+_NONE = EOGEvent.NONE
+_DOUBLE_BLINK = EOGEvent.DOUBLE_BLINK
+_TRIPLE_BLINK = EOGEvent.TRIPLE_BLINK
+_LONG_BLINK = EOGEvent.LONG_BLINK
+_LOOK_UP = EOGEvent.LOOK_UP
+_LOOK_DOWN = EOGEvent.LOOK_DOWN
+_LOOK_LEFT = EOGEvent.LOOK_LEFT
+_LOOK_RIGHT = EOGEvent.LOOK_RIGHT
+
 # Lazy-load pyautogui to allow testing without a display
 _pyautogui = None
 
+# X11 chord sender with precomputed keycodes (None → use pyautogui.hotkey)
+_x11_hotkey = None
+
 
 def _get_pyautogui():
     """Import and configure pyautogui on first use."""
-    global _pyautogui
+    global _pyautogui, _x11_hotkey
     if _pyautogui is None:
         import pyautogui
         pyautogui.FAILSAFE = False
         pyautogui.PAUSE = 0
         _pyautogui = pyautogui
+        _x11_hotkey = _make_x11_hotkey()
     return _pyautogui
 
 
+def _make_x11_hotkey():
+    """
+    Build a key-chord sender that talks to XTest directly.
+
+    Keycodes for the few keys we press are resolved once here, so each
+    back/forward skips pyautogui's per-call key-name parsing and lookup.
+    python-xlib is already pulled in by pyautogui on Linux.  Returns None
+    off X11 or if the display cannot be opened.
+    """
+    if not sys.platform.startswith('linux') or not os.environ.get('DISPLAY'):
+        return None
+    try:
+        from Xlib import X, XK
+        from Xlib.display import Display
+        from Xlib.ext import xtest
+        display = Display()
+    except Exception as e:
+        logger.debug(f"XTest hotkeys unavailable, using pyautogui: {e}")
+        return None
+
+    keycodes = {
+        name: display.keysym_to_keycode(XK.string_to_keysym(keysym))
+        for name, keysym in (('alt', 'Alt_L'), ('left', 'Left'), ('right', 'Right'))
+    }
+
+    def send(keys):
+        codes = [keycodes[k] for k in keys]
+        for kc in codes:
+            xtest.fake_input(display, X.KeyPress, kc)
+        for kc in reversed(codes):
+            xtest.fake_input(display, X.KeyRelease, kc)
+        display.sync()
+
+    return send
+
+
+def _send_hotkey(gui, *keys):
+    """Press a key chord, through XTest when available."""
+    if _x11_hotkey is not None and gui is _pyautogui:
+        _x11_hotkey(keys)
+    else:
+        gui.hotkey(*keys, _pause=False)
+
+
+class _ActionPump:
+    """
+    Runs GUI actions on a background thread.
+
+    Stands in for the pyautogui module inside update(): action calls are
+    queued and replayed in order by a daemon thread, so the sample loop
+    never waits on the display server.  moveRel calls still waiting in the
+    queue are merged into one.  size() is answered synchronously.
+    """
+
+    def __init__(self, gui):
+        self._gui = gui
+        self._queue = collections.deque()
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._drain, name="gui-actions", daemon=True)
+        self._thread.start()
+
+    def _submit(self, name, *args, **kwargs):
+        self._queue.append((name, args, kwargs))
+        self._wake.set()
+
+    def moveRel(self, dx, dy, _pause=False):
+        self._submit('moveRel', dx, dy, _pause=False)
+
+    def moveTo(self, x, y, _pause=False):
+        self._submit('moveTo', x, y, _pause=False)
+
+    def click(self, button='left', _pause=False):
+        self._submit('click', button=button, _pause=False)
+
+    def doubleClick(self, _pause=False):
+        self._submit('doubleClick', _pause=False)
+
+    def scroll(self, clicks, _pause=False):
+        self._submit('scroll', clicks, _pause=False)
+
+    def hotkey(self, *keys, _pause=False):
+        self._submit('hotkey', *keys)
+
+    def size(self):
+        return self._gui.size()
+
+    def _drain(self):
+        queue = self._queue
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while queue:
+                name, args, kwargs = queue.popleft()
+                if name == 'moveRel':
+                    dx, dy = args
+                    while queue and queue[0][0] == 'moveRel':
+                        next_dx, next_dy = queue.popleft()[1]
+                        dx += next_dx
+                        dy += next_dy
+                    args = (dx, dy)
+                try:
+                    if name == 'hotkey':
+                        _send_hotkey(self._gui, *args)
+                    else:
+                        getattr(self._gui, name)(*args, **kwargs)
+                except Exception as e:
+                    logger.warning(f"GUI action {name} failed: {e}")
+
+
+# Neutral gaze bands as centre and half-width: "outside the band" is then a
+# single abs() compare instead of two compares and an or
+_V_BAND_CENTER = (config.LOOK_UP_THRESHOLD + config.LOOK_DOWN_THRESHOLD) / 2
+_V_BAND_HALF = (config.LOOK_UP_THRESHOLD - config.LOOK_DOWN_THRESHOLD) / 2
+_H_BAND_CENTER = (config.LOOK_RIGHT_THRESHOLD + config.LOOK_LEFT_THRESHOLD) / 2
+_H_BAND_HALF = (config.LOOK_RIGHT_THRESHOLD - config.LOOK_LEFT_THRESHOLD) / 2
+
+
+def gaze_flags(eog_v, eog_h):
+    """
+    Return (gaze_vertical, gaze_horizontal) for the cursor-suppression gate.
+
+    Works on scalars or NumPy arrays alike, so offline replay can evaluate
+    every sample of a recording in one vectorized pass and hand the
+    per-sample results to update(gaze=...).
+    """
+    gaze_vertical = abs(eog_v - _V_BAND_CENTER) > _V_BAND_HALF
+    gaze_horizontal = abs(eog_h - _H_BAND_CENTER) > _H_BAND_HALF
+    return gaze_vertical, gaze_horizontal
+
+
 class _BaseController:
     """
     Shared event detection and action dispatch for all cursor controllers.
 
     Subclasses implement _compute_cursor_move() to define how IMU gyro
-    data maps to pixel displacement.
+    data maps to pixel displacement.  It is pure arithmetic returning
+    (dx, dy); update() accumulates it and flushes whole pixels to
+    moveRel at most every CURSOR_FLUSH_INTERVAL, so motion at 200 Hz costs
+    ~60 display-server round trips per second and sub-pixel motion is not
+    lost.  Subclasses with motion state clear it in _reset_move(), called
+    from reset().  With action_thread=True, GUI calls are handed to a
+    background _ActionPump instead of blocking the sample loop.
 
     "Cursor frozen" means the user is looking left or right (horizontal
     EOG beyond threshold).  Double nod is only recognised in this state,
@@ -58,9 +212,15 @@ class _BaseController:
     eliminates cursor drift during nods.
     """
 
-    def __init__(self, keyboard_overlay=None):
+    def __init__(self, keyboard_overlay=None, action_thread=False):
         self.deadzone = config.GYRO_DEADZONE
         self.keyboard_overlay = keyboard_overlay
+
+        # GUI sink: pyautogui, or an _ActionPump around it when action_thread
+        # is set.  Resolved once, on the first update, so constructing a
+        # controller needs no display.
+        self.action_thread = action_thread
+        self._gui = None
       
         # Event detectors
         self.blink_detector = BlinkDetector()
@@ -68,10 +228,16 @@ class _BaseController:
         self.horizontal_gaze_detector = HorizontalGazeDetector()
         self.nod_detector = DoubleNodDetector()
 
-        # Fusion cooldown state
-        self.last_scroll_time = 0.0
-        self.last_nav_time = 0.0
-        self.last_nod_time = 0.0
+        # Coalesced cursor motion not yet sent to the OS (pixels)
+        self._pending_dx = 0.0
+        self._pending_dy = 0.0
+        self._next_flush = 0.0
+
+        # Fusion cooldown state, stored as absolute deadlines so each gate
+        # is a single comparison against `now`
+        self.next_scroll_time = 0.0
+        self.next_nav_time = 0.0
+        self.nod_grace_until = 0.0
 
         # Scroll ready state: eyes lock cursor into scroll mode before head confirms
         # "IDLE" | "SCROLL_UP_READY" | "SCROLL_DOWN_READY"
@@ -81,12 +247,16 @@ class _BaseController:
         # "IDLE" | "NAV_LEFT_READY" | "NAV_RIGHT_READY"
         self.nav_state = "IDLE"
 
-    def _compute_cursor_move(self, gx, gy, any_action, gui):
-        """Compute and apply cursor movement. Subclasses must override."""
+        # Cursor-frozen state of the previous sample (nod detector arming)
+        self._was_frozen = False
+
+    def _compute_cursor_move(self, gx, gy, any_action) -> tuple[float, float]:
+        """Return cursor displacement (dx, dy) in pixels. Subclasses must override."""
         raise NotImplementedError
 
     def update(self, eog_v: int, eog_h: int, gx: int, gy: int, gz: int,
-               cursor_frozen_override: bool = False):
+               cursor_frozen_override: bool = False, now: float = None,
+               gaze: tuple[bool, bool] = None, blink: EOGEvent = None):
         """
         Process one sensor sample and execute actions.
 
@@ -98,14 +268,24 @@ class _BaseController:
             cursor_frozen_override: When True, force cursor-frozen state
                 even if eog_h is at baseline.  Used by ML mode to signal
                 that the classifier detected horizontal gaze.
+            now: Sample time in seconds (default: time.monotonic()).  Offline
+                replay passes recording time so durations and cooldowns
+                are measured in signal time, not replay wall time.
+            gaze: Precomputed gaze_flags(eog_v, eog_h) for this sample,
+                e.g. from a vectorized pass over a whole recording.
+            blink: Precomputed blink event for this sample (see
+                detect_blinks()); the blink detector is skipped when given.
         """
-        now = time.time()
-        gui = _get_pyautogui()
+        if now is None:
+            now = time.monotonic()
+        gui = self._gui
+        if gui is None:
+            gui = self._gui = self._bind_gui()
 
         # --- 0. Keyboard overlay (independent EOG events from keyboard) ---
-        kb_blink = EOGEvent.NONE
-        kb_gaze = EOGEvent.NONE
-        kb_horiz = EOGEvent.NONE
+        kb_blink = _NONE
+        kb_gaze = _NONE
+        kb_horiz = _NONE
         kb_cursor_frozen = False
         if self.keyboard_overlay:
             kb_blink, kb_gaze, kb_horiz, kb_cursor_frozen = (
@@ -117,30 +297,38 @@ class _BaseController:
         #   - Eye gaze (vertical/horizontal) = scroll/nav intent
         #   - Keyboard overlay gaze = same intent via keyboard
         #   - Post-nod grace window absorbs residual coupled motion
-        gaze_vertical = (eog_v > config.LOOK_UP_THRESHOLD or
-                         eog_v < config.LOOK_DOWN_THRESHOLD)
-        gaze_horizontal = (eog_h > config.LOOK_RIGHT_THRESHOLD or
-                           eog_h < config.LOOK_LEFT_THRESHOLD)
+        if gaze is None:
+            gaze = gaze_flags(eog_v, eog_h)
+        gaze_vertical, gaze_horizontal = gaze
         cursor_frozen = gaze_horizontal or cursor_frozen_override or kb_cursor_frozen
 
         any_action = (gaze_vertical or cursor_frozen or
-                      kb_gaze != EOGEvent.NONE or
-                      now - self.last_nod_time < config.DOUBLE_NOD_COOLDOWN)
+                      kb_gaze is not _NONE or
+                      now < self.nod_grace_until)
                  
-        self._compute_cursor_move(gx, gy, any_action, gui)
+        dx, dy = self._compute_cursor_move(gx, gy, any_action)
+        self._pending_dx += dx
+        self._pending_dy += dy
+        if now >= self._next_flush:
+            self._flush_move(gui, now)
 
         # --- 2. Blink events (double → left click, triple → double click, long → right click) ---
-        blink_event = self.blink_detector.update(eog_v, now)
-        if blink_event == EOGEvent.NONE:
+        if blink is None:
+            blink = self.blink_detector.update(eog_v, now)
+        blink_event = blink
+        if blink_event is _NONE:
             blink_event = kb_blink  # keyboard fallback
                  
-        if blink_event == EOGEvent.DOUBLE_BLINK:
+        if blink_event is not _NONE:
+            self._flush_move(gui, now)  # click where the cursor should be
+
+        if blink_event is _DOUBLE_BLINK:
             gui.click(_pause=False)
             logger.info("Double blink → left click")
-        elif blink_event == EOGEvent.TRIPLE_BLINK:
+        elif blink_event is _TRIPLE_BLINK:
             gui.doubleClick(_pause=False)
             logger.info("Triple blink → double click")
-        elif blink_event == EOGEvent.LONG_BLINK:
+        elif blink_event is _LONG_BLINK:
             gui.click(button='right', _pause=False)
             logger.info("Long blink → right click")
 
@@ -148,34 +336,50 @@ class _BaseController:
         # Step 1: eye gaze locks cursor into SCROLL_UP_READY or SCROLL_DOWN_READY.
         # Step 2: only while locked, head tilt triggers the actual scroll.
         # Eyes returning to neutral resets to IDLE.
-        gaze_event = self.gaze_detector.update(eog_v, now)
-        if gaze_event == EOGEvent.NONE:
+        # Outside the vertical gaze band the detector can only clear its
+        # state, so do that inline instead of calling it.
+        if gaze_vertical:
+            gaze_event = self.gaze_detector.update(eog_v, now)
+        else:
+            self.gaze_detector.current_gaze = _NONE
+            gaze_event = _NONE
+        if gaze_event is _NONE:
             gaze_event = kb_gaze  # keyboard fallback
 
-        if gaze_event == EOGEvent.LOOK_UP:
+        if gaze_event is _LOOK_UP:
             self.scroll_state = "SCROLL_UP_READY"
-        elif gaze_event == EOGEvent.LOOK_DOWN:
+        elif gaze_event is _LOOK_DOWN:
             self.scroll_state = "SCROLL_DOWN_READY"
         else:
             self.scroll_state = "IDLE"
 
         if self.scroll_state == "SCROLL_UP_READY" and gx < -self.deadzone:
-            if now - self.last_scroll_time > config.SCROLL_COOLDOWN:
+            if now > self.next_scroll_time:
                 amount = max(1, int(abs(gx) / self.deadzone * config.SCROLL_AMOUNT))
                 gui.scroll(amount, _pause=False)
-                self.last_scroll_time = now
-                logger.info(f"Scroll up {amount} lines (scroll ready + head up)")
+                self.next_scroll_time = now + config.SCROLL_COOLDOWN
+                logger.info("Scroll up %d lines (scroll ready + head up)", amount)
         elif self.scroll_state == "SCROLL_DOWN_READY" and gx > self.deadzone:
-            if now - self.last_scroll_time > config.SCROLL_COOLDOWN:
+            if now > self.next_scroll_time:
                 amount = max(1, int(abs(gx) / self.deadzone * config.SCROLL_AMOUNT))
                 gui.scroll(-amount, _pause=False)
-                self.last_scroll_time = now
-                logger.info(f"Scroll down {amount} lines (scroll ready + head down)")
+                self.next_scroll_time = now + config.SCROLL_COOLDOWN
+                logger.info("Scroll down %d lines (scroll ready + head down)", amount)
 
         # --- 4. Center cursor: double head nod (only while cursor frozen) ---
-        nod_event = self.nod_detector.update(gx, now, cursor_frozen=cursor_frozen)
+        # Not called at all while unfrozen; a half-seen nod is dropped once,
+        # when the cursor unfreezes.
+        if cursor_frozen:
+            nod_event = self.nod_detector.update(gx, now, cursor_frozen=True)
+        else:
+            if self._was_frozen:
+                self.nod_detector.disarm()
+            nod_event = None
+        self._was_frozen = cursor_frozen
         if nod_event == "center_cursor":
-            self.last_nod_time = now
+            self.nod_grace_until = now + config.DOUBLE_NOD_COOLDOWN
+            self._pending_dx = 0.0
+            self._pending_dy = 0.0
             screen_w, screen_h = gui.size()
             gui.moveTo(screen_w // 2, screen_h // 2, _pause=False)
             logger.info("Double nod → center cursor")
@@ -184,40 +388,69 @@ class _BaseController:
         # Step 1: horizontal gaze locks cursor into NAV_LEFT_READY or NAV_RIGHT_READY.
         # Step 2: only while locked, head turn triggers browser back/forward.
         # Eyes returning to neutral resets to IDLE.
-        horiz_event = self.horizontal_gaze_detector.update(eog_h, now)
-        if horiz_event == EOGEvent.NONE:
+        if gaze_horizontal:
+            horiz_event = self.horizontal_gaze_detector.update(eog_h, now)
+        else:
+            self.horizontal_gaze_detector.current_gaze = _NONE
+            horiz_event = _NONE
+        if horiz_event is _NONE:
             horiz_event = kb_horiz  # keyboard fallback
 
-        if horiz_event == EOGEvent.LOOK_LEFT:
+        if horiz_event is _LOOK_LEFT:
             self.nav_state = "NAV_LEFT_READY"
-        elif horiz_event == EOGEvent.LOOK_RIGHT:
+        elif horiz_event is _LOOK_RIGHT:
             self.nav_state = "NAV_RIGHT_READY"
         else:
             self.nav_state = "IDLE"
 
         if self.nav_state == "NAV_LEFT_READY" and gy < -self.deadzone:
-            if now - self.last_nav_time > config.HORIZONTAL_GAZE_COOLDOWN:
-                gui.hotkey('alt', 'left', _pause=False)
-                self.last_nav_time = now
+            if now > self.next_nav_time:
+                _send_hotkey(gui, 'alt', 'left')
+                self.next_nav_time = now + config.HORIZONTAL_GAZE_COOLDOWN
                 logger.info("Back (nav ready + head left)")
         elif self.nav_state == "NAV_RIGHT_READY" and gy > self.deadzone:
-            if now - self.last_nav_time > config.HORIZONTAL_GAZE_COOLDOWN:
-                gui.hotkey('alt', 'right', _pause=False)
-                self.last_nav_time = now
+            if now > self.next_nav_time:
+                _send_hotkey(gui, 'alt', 'right')
+                self.next_nav_time = now + config.HORIZONTAL_GAZE_COOLDOWN
                 logger.info("Forward (nav ready + head right)")
 
+    def _bind_gui(self):
+        """Resolve the GUI sink used by update()."""
+        gui = _get_pyautogui()
+        if self.action_thread:
+            gui = _ActionPump(gui)
+        return gui
+
     def reset(self):
-        """Reset all detector state."""
+        """Reset all detector and movement state."""
         self.blink_detector.reset()
         self.gaze_detector.reset()
         self.horizontal_gaze_detector.reset()
         self.nod_detector.reset()
-        self.last_scroll_time = 0.0
-        self.last_nav_time = 0.0
-        self.last_nod_time = 0.0
+        self.next_scroll_time = 0.0
+        self.next_nav_time = 0.0
+        self.nod_grace_until = 0.0
         self.scroll_state = "IDLE"
         self.nav_state = "IDLE"
-      
+        self._was_frozen = False
+        self._pending_dx = 0.0
+        self._pending_dy = 0.0
+        self._next_flush = 0.0
+        self._reset_move()
+
+    def _flush_move(self, gui, now):
+        """Send accumulated whole-pixel motion; keep the fractional remainder."""
+        self._next_flush = now + config.CURSOR_FLUSH_INTERVAL
+        move_x = round(self._pending_dx)
+        move_y = round(self._pending_dy)
+        if move_x or move_y:
+            gui.moveRel(move_x, move_y, _pause=False)
+            self._pending_dx -= move_x
+            self._pending_dy -= move_y
+
+    def _reset_move(self):
+        """Clear movement-model state. Stateless movement needs nothing."""
+
 
 class ThresholdController(_BaseController):
     """
@@ -227,22 +460,22 @@ class ThresholdController(_BaseController):
     proportional to gyro angular velocity (no inertia).
     """
 
-    def __init__(self, keyboard_overlay=None):
-        super().__init__(keyboard_overlay)
+    def __init__(self, keyboard_overlay=None, action_thread=False):
+        super().__init__(keyboard_overlay, action_thread)
         self.sensitivity = config.CURSOR_SENSITIVITY
 
-    def _compute_cursor_move(self, gx, gy, any_action, gui):
+    def _compute_cursor_move(self, gx, gy, any_action):
         dx = 0.0
         dy = 0.0
 
         if not any_action:
-            if abs(gy) > self.deadzone:
+            deadzone = self.deadzone
+            if abs(gy) > deadzone:
                 dx = gy * self.sensitivity
-            if abs(gx) > self.deadzone:
+            if abs(gx) > deadzone:
                 dy = gx * self.sensitivity
 
-        if dx != 0 or dy != 0:
-            gui.moveRel(dx, dy, _pause=False)
+        return dx, dy
 
 
 class StateSpaceController(_BaseController):
@@ -255,60 +488,61 @@ class StateSpaceController(_BaseController):
     State equation: x[k+1] = A * x[k] + B * u[k]
     - A contains velocity retention (velocity decays exponentially)
     - B maps gyro input to velocity changes
+    A and B are constant and sparse, so the update is written out as
+    scalar equations rather than matrix products.  Position is re-zeroed
+    every step, so only the velocities persist; they are kept as plain
+    floats (vx, vy) rather than in a NumPy array, whose scalar indexing
+    would dominate the per-sample cost.
 
     Double nod only activates when the cursor is frozen
     (user is looking left or right). Double nod centers the cursor.
     """
 
-    def __init__(self, keyboard_overlay=None):
-        super().__init__(keyboard_overlay)
+    def __init__(self, keyboard_overlay=None, action_thread=False):
+        super().__init__(keyboard_overlay, action_thread)
         self.velocity_retain = config.SS_VELOCITY_RETAIN
         self.sensitivity = config.SS_SENSITIVITY
         self.dt = config.SS_DT
 
-        # State: [pos_x, vel_x, pos_y, vel_y]
-        self.state = np.zeros(4)
-
-        # State transition matrix
-        self.A = np.array([
-            [1, self.dt,      0, 0],
-            [0, self.velocity_retain, 0, 0],
-            [0, 0,            1, self.dt],
-            [0, 0,            0, self.velocity_retain]
-        ])
-
-        # Input matrix (gyro → velocity)
-        self.B = np.array([
-            [0,               0],
-            [self.sensitivity, 0],
-            [0,               0],
-            [0,               self.sensitivity]
-        ])
-
-    def _compute_cursor_move(self, gx, gy, any_action, gui):
+        # Velocity state (vel_x, vel_y)
+        self.vx = 0.0
+        self.vy = 0.0
+
+    @property
+    def state(self) -> np.ndarray:
+        """Snapshot of the state vector [pos_x, vel_x, pos_y, vel_y]."""
+        return np.array([0.0, self.vx, 0.0, self.vy])
+
+    def _compute_cursor_move(self, gx, gy, any_action):
         if any_action:
-            u = np.array([0, 0])
+            ux = 0
+            uy = 0
             # Zero velocity to freeze cursor immediately
-            self.state[1] = 0
-            self.state[3] = 0
+            vx = vy = 0.0
         else:
-            ux = gy if abs(gy) > self.deadzone else 0
-            uy = gx if abs(gx) > self.deadzone else 0
-            u = np.array([ux, uy])
-
-        self.state = self.A @ self.state + self.B @ u
-
-        dx = self.state[0]
-        dy = self.state[2]
-
+            deadzone = self.deadzone
+            ux = gy if abs(gy) > deadzone else 0
+            uy = gx if abs(gx) > deadzone else 0
+            vx = self.vx
+            vy = self.vy
+
+        # x[k+1] = A x[k] + B u[k], expanded: A and B are sparse and constant,
+        # so the matrix products reduce to two multiply-adds per axis.
+        # Position is reset every step, so the displacement is dt * vel[k].
+        dt = self.dt
+        retain = self.velocity_retain
+        sensitivity = self.sensitivity
+        dx = dt * vx
+        dy = dt * vy
+        self.vx = retain * vx + sensitivity * ux
+        self.vy = retain * vy + sensitivity * uy
+
+        # Sub-pixel glide tail: don't issue a move
         if abs(dx) > 0.1 or abs(dy) > 0.1:
-            gui.moveRel(dx, dy, _pause=False)
+            return dx, dy
+        return 0.0, 0.0
 
-        # Reset position accumulator, keep velocity
-        self.state[0] = 0
-        self.state[2] = 0
-
-    def reset(self):
-        """Reset all internal state."""
-        super().reset()
-        self.state = np.zeros(4)
+    def _reset_move(self):
+        """Stop any glide: clear velocity."""
+        self.vx = 0.0
+        self.vy = 0.0
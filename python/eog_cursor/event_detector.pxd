@@ -0,0 +1,45 @@
+# Cython declarations for event_detector.py (pure-Python mode).
+#
+# Only read by `EOG_CURSOR_COMPILE=1 pip install .` (see setup.py): the
+# detectors become extension types with C-typed fields, so the per-sample
+# attribute reads and writes in update() skip the instance __dict__.
+# Fields that may hold None or Enum members stay `object`.  Everything is
+# `public` so the pure-Python and compiled builds expose the same attributes.
+
+cdef class BlinkDetector:
+    cdef public object state
+    cdef public double blink_start_time
+    cdef public double blink_end_time
+    cdef public int blink_count
+    cdef public double last_event_time
+    cdef public double _threshold
+    cdef public double _double_window
+    cdef public double _triple_window
+
+
+cdef class GazeDetector:
+    cdef public double gaze_start_time
+    cdef public object current_gaze
+    cdef public double _min_gaze_duration
+    cdef public double _blink_threshold
+    cdef public double _up_threshold
+    cdef public double _down_threshold
+
+
+cdef class HorizontalGazeDetector:
+    cdef public double gaze_start_time
+    cdef public object current_gaze
+    cdef public double _min_gaze_duration
+    cdef public double last_trigger_time
+    cdef public double _left_threshold
+    cdef public double _right_threshold
+
+
+cdef class DoubleNodDetector:
+    cdef public double last_trigger_time
+    cdef public object _spike_start
+    cdef public bint _suppressed
+    cdef public object _first_nod_time
+    cdef public double _threshold
+    cdef public double _max_duration
+    cdef public double _window
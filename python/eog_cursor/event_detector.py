@@ -25,6 +25,8 @@ import time
 import logging
 from enum import Enum, auto
 
+import numpy as np
+
 from . import config
 
 logger = logging.getLogger(__name__)
@@ -50,6 +52,23 @@ class EOGEvent(Enum):
     LOOK_RIGHT = auto()     # → browser forward
 
 
+# Members bound as module globals.  Attribute access on an Enum class is
+# several times slower than a global load, and members are singletons, so
+# the per-sample paths use these and compare with `is`.
+_IDLE = BlinkState.IDLE
+_IN_BLINK = BlinkState.IN_BLINK
+_WAIT_SECOND = BlinkState.WAIT_SECOND
+_WAIT_THIRD = BlinkState.WAIT_THIRD
+_NONE = EOGEvent.NONE
+_DOUBLE_BLINK = EOGEvent.DOUBLE_BLINK
+_TRIPLE_BLINK = EOGEvent.TRIPLE_BLINK
+_LONG_BLINK = EOGEvent.LONG_BLINK
+_LOOK_UP = EOGEvent.LOOK_UP
+_LOOK_DOWN = EOGEvent.LOOK_DOWN
+_LOOK_LEFT = EOGEvent.LOOK_LEFT
+_LOOK_RIGHT = EOGEvent.LOOK_RIGHT
+
+
 class BlinkDetector:
     """
     Detects double-blink, triple-blink, and long-blink patterns from raw EOG values.
@@ -67,36 +86,48 @@ class BlinkDetector:
       IN_BLINK (3rd) → (EOG < threshold) → emit TRIPLE_BLINK → IDLE
     """
 
+    # Fixed attribute set: no per-instance __dict__, slot access on the hot path
+    __slots__ = ('state', 'blink_start_time', 'blink_end_time', 'blink_count',
+                 'last_event_time', '_threshold', '_double_window', '_triple_window')
+
     def __init__(self):
-        self.state = BlinkState.IDLE
+        self.state = _IDLE
         self.blink_start_time = 0.0
         self.blink_end_time = 0.0
         self.blink_count = 0
         self.last_event_time = -100.0  # Allow first event immediately
 
+        # Per-sample thresholds bound once (skips module attribute lookups)
+        self._threshold = config.BLINK_THRESHOLD
+        self._double_window = config.DOUBLE_BLINK_WINDOW
+        self._triple_window = config.TRIPLE_BLINK_WINDOW
+
     def update(self, eog: int, now: float = None) -> EOGEvent:
         """
         Feed one EOG sample and return detected event.
 
         Args:
             eog: Raw 12-bit ADC value
-            now: Current time (default: time.time())
+            now: Current time (default: time.monotonic())
 
         Returns:
             EOGEvent.DOUBLE_BLINK, TRIPLE_BLINK, LONG_BLINK, or NONE
         """
-        if now is None:
-            now = time.time()
-
-        is_high = eog > config.BLINK_THRESHOLD
+        is_high = eog > self._threshold
+        state = self.state
 
-        if self.state == BlinkState.IDLE:
+        # Fast path: idle and below threshold is the overwhelmingly common case
+        if state is _IDLE:
             if is_high:
-                self.state = BlinkState.IN_BLINK
-                self.blink_start_time = now
+                self.state = _IN_BLINK
+                self.blink_start_time = time.monotonic() if now is None else now
                 self.blink_count = 1
+            return _NONE
+
+        if now is None:
+            now = time.monotonic()
 
-        elif self.state == BlinkState.IN_BLINK:
+        if state is _IN_BLINK:
             duration = now - self.blink_start_time
 
             if is_high:
@@ -106,79 +137,183 @@ class BlinkDetector:
                 # EOG dropped below threshold — blink ended, check duration
                 if duration < config.BLINK_MIN_DURATION:
                     # Too short, probably noise
-                    self.state = BlinkState.IDLE
+                    self.state = _IDLE
                 elif self.blink_count >= 3:
                     # Third blink ended → triple blink!
                     if duration <= config.BLINK_MAX_DURATION:
                         if now - self.last_event_time > config.TRIPLE_BLINK_COOLDOWN:
-                            self.state = BlinkState.IDLE
+                            self.state = _IDLE
                             self.last_event_time = now
                             logger.debug("Triple blink detected")
-                            return EOGEvent.TRIPLE_BLINK
-                    self.state = BlinkState.IDLE
+                            return _TRIPLE_BLINK
+                    self.state = _IDLE
                 elif self.blink_count >= 2:
                     # Second blink ended → wait for potential third
                     if duration <= config.BLINK_MAX_DURATION:
                         self.blink_end_time = now
-                        self.state = BlinkState.WAIT_THIRD
+                        self.state = _WAIT_THIRD
                     else:
-                        self.state = BlinkState.IDLE
+                        self.state = _IDLE
                 elif duration >= config.LONG_BLINK_MIN_DURATION:
                     # Long blink (right click) — fires on release
                     if duration <= config.LONG_BLINK_MAX_DURATION:
                         if now - self.last_event_time > config.LONG_BLINK_COOLDOWN:
-                            self.state = BlinkState.IDLE
+                            self.state = _IDLE
                             self.last_event_time = now
-                            logger.debug(f"Long blink detected ({duration:.2f}s)")
-                            return EOGEvent.LONG_BLINK
+                            logger.debug("Long blink detected (%.2fs)", duration)
+                            return _LONG_BLINK
                     # duration > MAX or cooldown blocked — discard
-                    self.state = BlinkState.IDLE
+                    self.state = _IDLE
                 elif duration <= config.BLINK_MAX_DURATION:
                     # Normal blink (50-250ms), wait for second
                     self.blink_end_time = now
-                    self.state = BlinkState.WAIT_SECOND
+                    self.state = _WAIT_SECOND
                 else:
                     # Ambiguous (250ms-400ms gap), discard
-                    self.state = BlinkState.IDLE
+                    self.state = _IDLE
 
-        elif self.state == BlinkState.WAIT_SECOND:
+        elif state is _WAIT_SECOND:
             elapsed = now - self.blink_end_time
 
-            if is_high and elapsed < config.DOUBLE_BLINK_WINDOW:
+            if is_high and elapsed < self._double_window:
                 # Second blink started!
-                self.state = BlinkState.IN_BLINK
+                self.state = _IN_BLINK
                 self.blink_start_time = now
                 self.blink_count = 2
-            elif elapsed >= config.DOUBLE_BLINK_WINDOW:
+            elif elapsed >= self._double_window:
                 # Timeout - was just a single blink, ignore it
-                self.state = BlinkState.IDLE
+                self.state = _IDLE
 
-        elif self.state == BlinkState.WAIT_THIRD:
+        elif state is _WAIT_THIRD:
             elapsed = now - self.blink_end_time
 
-            if is_high and elapsed < config.TRIPLE_BLINK_WINDOW:
+            if is_high and elapsed < self._triple_window:
                 # Third blink started!
-                self.state = BlinkState.IN_BLINK
+                self.state = _IN_BLINK
                 self.blink_start_time = now
                 self.blink_count = 3
-            elif elapsed >= config.TRIPLE_BLINK_WINDOW:
+            elif elapsed >= self._triple_window:
                 # Timeout - was a double blink (no third blink came)
                 if now - self.last_event_time > config.DOUBLE_BLINK_COOLDOWN:
                     self.last_event_time = now
-                    self.state = BlinkState.IDLE
+                    self.state = _IDLE
                     logger.debug("Double blink detected")
-                    return EOGEvent.DOUBLE_BLINK
-                self.state = BlinkState.IDLE
+                    return _DOUBLE_BLINK
+                self.state = _IDLE
 
-        return EOGEvent.NONE
+        return _NONE
 
     def reset(self):
         """Reset state machine."""
-        self.state = BlinkState.IDLE
+        self.state = _IDLE
         self.blink_count = 0
         self.last_event_time = -100.0
 
 
+# Event log returned by detect_blinks(): sample index, time, EOGEvent value
+BLINK_EVENT_DTYPE = np.dtype([('index', 'i8'), ('time', 'f8'), ('event', 'i1')])
+
+
+def detect_blinks(eog, t) -> np.ndarray:
+    """
+    Run the BlinkDetector state machine over a whole recording at once.
+
+    Produces the same events at the same samples as feeding BlinkDetector
+    one sample at a time with now=t[i], but only visits threshold crossings:
+    rises and falls come from np.diff of the above-threshold mask, and the
+    state machine then steps once per blink instead of once per sample.
+
+    Args:
+        eog: Vertical EOG samples (1-D array)
+        t: Sample times in seconds, non-decreasing, same length as eog
+
+    Returns:
+        Structured array of BLINK_EVENT_DTYPE, in time order.
+    """
+    eog = np.asarray(eog)
+    t = np.asarray(t, dtype=float)
+    n = eog.size
+
+    edges = np.diff((eog > config.BLINK_THRESHOLD).astype(np.int8), prepend=0, append=0)
+    rises = np.flatnonzero(edges == 1)
+    falls = np.flatnonzero(edges == -1)  # first low sample; n if still high at the end
+
+    events = []
+    last_event_time = -100.0
+    state = BlinkState.IDLE
+    blink_count = 0
+    end_idx = 0
+
+    def timeout(window, stop):
+        """First sample in (end_idx, stop] where the wait window has expired."""
+        # Binary search on the sorted times, then settle the edge with the
+        # same subtraction update() does so rounding cannot move it
+        t0 = t[end_idx]
+        k = max(int(np.searchsorted(t, t0 + window)), end_idx + 1)
+        while k > end_idx + 1 and t[k - 1] - t0 >= window:
+            k -= 1
+        while k <= stop and t[k] - t0 < window:
+            k += 1
+        return k if k <= stop else None
+
+    for rise, fall in zip(rises.tolist(), falls.tolist()):
+        start = rise
+        if state is not BlinkState.IDLE:
+            window = (config.DOUBLE_BLINK_WINDOW if state is BlinkState.WAIT_SECOND
+                      else config.TRIPLE_BLINK_WINDOW)
+            k = timeout(window, rise)
+            if k is None:
+                blink_count += 1
+            else:
+                if (state is BlinkState.WAIT_THIRD
+                        and t[k] - last_event_time > config.DOUBLE_BLINK_COOLDOWN):
+                    last_event_time = t[k]
+                    events.append((k, t[k], EOGEvent.DOUBLE_BLINK.value))
+                state = BlinkState.IDLE
+                if k == rise:
+                    # The timeout sample consumed the rise; start on the next one
+                    start = rise + 1
+                    if start >= fall:
+                        continue
+        if state is BlinkState.IDLE:
+            blink_count = 1
+
+        if fall >= n:
+            state = BlinkState.IN_BLINK
+            break
+
+        # Blink ended — same duration rules as BlinkDetector.update()
+        now = t[fall]
+        duration = now - t[start]
+        state = BlinkState.IDLE
+        if duration < config.BLINK_MIN_DURATION:
+            pass
+        elif blink_count >= 3:
+            if (duration <= config.BLINK_MAX_DURATION
+                    and now - last_event_time > config.TRIPLE_BLINK_COOLDOWN):
+                last_event_time = now
+                events.append((fall, now, EOGEvent.TRIPLE_BLINK.value))
+        elif blink_count >= 2:
+            if duration <= config.BLINK_MAX_DURATION:
+                state = BlinkState.WAIT_THIRD
+        elif duration >= config.LONG_BLINK_MIN_DURATION:
+            if (duration <= config.LONG_BLINK_MAX_DURATION
+                    and now - last_event_time > config.LONG_BLINK_COOLDOWN):
+                last_event_time = now
+                events.append((fall, now, EOGEvent.LONG_BLINK.value))
+        elif duration <= config.BLINK_MAX_DURATION:
+            state = BlinkState.WAIT_SECOND
+        end_idx = fall
+
+    # A double blink still waiting for its third blink times out after the last rise
+    if state is BlinkState.WAIT_THIRD:
+        k = timeout(config.TRIPLE_BLINK_WINDOW, n - 1)
+        if k is not None and t[k] - last_event_time > config.DOUBLE_BLINK_COOLDOWN:
+            events.append((k, t[k], EOGEvent.DOUBLE_BLINK.value))
+
+    return np.array(events, dtype=BLINK_EVENT_DTYPE)
+
+
 class GazeDetector:
     """
     Detects sustained gaze direction from EOG values.
@@ -187,10 +322,16 @@ class GazeDetector:
     to stay in the threshold region for a minimum duration.
     """
 
+    __slots__ = ('gaze_start_time', 'current_gaze', '_min_gaze_duration',
+                 '_blink_threshold', '_up_threshold', '_down_threshold')
+
     def __init__(self):
         self.gaze_start_time = 0.0
-        self.current_gaze = EOGEvent.NONE
+        self.current_gaze = _NONE
         self._min_gaze_duration = 0.1  # seconds to confirm gaze
+        self._blink_threshold = config.BLINK_THRESHOLD
+        self._up_threshold = config.LOOK_UP_THRESHOLD
+        self._down_threshold = config.LOOK_DOWN_THRESHOLD
 
     def update(self, eog: int, now: float = None) -> EOGEvent:
         """
@@ -200,72 +341,77 @@ class GazeDetector:
         sustained deviations from baseline.
         """
         if now is None:
-            now = time.time()
+            now = time.monotonic()
 
         # Don't detect gaze during blink-level signals
-        if eog > config.BLINK_THRESHOLD:
-            self.current_gaze = EOGEvent.NONE
-            return EOGEvent.NONE
-
-        if eog > config.LOOK_UP_THRESHOLD:
-            new_gaze = EOGEvent.LOOK_UP
-        elif eog < config.LOOK_DOWN_THRESHOLD:
-            new_gaze = EOGEvent.LOOK_DOWN
+        if eog > self._blink_threshold:
+            self.current_gaze = _NONE
+            return _NONE
+
+        if eog > self._up_threshold:
+            new_gaze = _LOOK_UP
+        elif eog < self._down_threshold:
+            new_gaze = _LOOK_DOWN
         else:
-            self.current_gaze = EOGEvent.NONE
-            return EOGEvent.NONE
+            self.current_gaze = _NONE
+            return _NONE
 
-        if new_gaze != self.current_gaze:
+        if new_gaze is not self.current_gaze:
             self.current_gaze = new_gaze
             self.gaze_start_time = now
-            return EOGEvent.NONE
+            return _NONE
 
         # Sustained gaze detected
         if now - self.gaze_start_time >= self._min_gaze_duration:
             return self.current_gaze
 
-        return EOGEvent.NONE
+        return _NONE
 
     def reset(self):
-        self.current_gaze = EOGEvent.NONE
+        self.current_gaze = _NONE
 
 
 class HorizontalGazeDetector:
     """Detects sustained horizontal gaze from eog_h values."""
 
+    __slots__ = ('gaze_start_time', 'current_gaze', '_min_gaze_duration',
+                 'last_trigger_time', '_left_threshold', '_right_threshold')
+
     def __init__(self):
         self.gaze_start_time = 0.0
-        self.current_gaze = EOGEvent.NONE
+        self.current_gaze = _NONE
         self._min_gaze_duration = 0.15  # slightly longer to avoid false triggers
         self.last_trigger_time = -100.0
+        self._left_threshold = config.LOOK_LEFT_THRESHOLD
+        self._right_threshold = config.LOOK_RIGHT_THRESHOLD
 
     def update(self, eog_h: int, now: float = None) -> EOGEvent:
         """Feed one horizontal EOG sample, return LOOK_LEFT/LOOK_RIGHT if sustained."""
         if now is None:
-            now = time.time()
+            now = time.monotonic()
 
-        if eog_h > config.LOOK_RIGHT_THRESHOLD:
-            new_gaze = EOGEvent.LOOK_RIGHT
-        elif eog_h < config.LOOK_LEFT_THRESHOLD:
-            new_gaze = EOGEvent.LOOK_LEFT
+        if eog_h > self._right_threshold:
+            new_gaze = _LOOK_RIGHT
+        elif eog_h < self._left_threshold:
+            new_gaze = _LOOK_LEFT
         else:
-            self.current_gaze = EOGEvent.NONE
-            return EOGEvent.NONE
+            self.current_gaze = _NONE
+            return _NONE
 
-        if new_gaze != self.current_gaze:
+        if new_gaze is not self.current_gaze:
             self.current_gaze = new_gaze
             self.gaze_start_time = now
-            return EOGEvent.NONE
+            return _NONE
 
         if now - self.gaze_start_time >= self._min_gaze_duration:
             if now - self.last_trigger_time > config.HORIZONTAL_GAZE_COOLDOWN:
                 self.last_trigger_time = now
                 return self.current_gaze
 
-        return EOGEvent.NONE
+        return _NONE
 
     def reset(self):
-        self.current_gaze = EOGEvent.NONE
+        self.current_gaze = _NONE
         self.last_trigger_time = -100.0
 
 
@@ -281,11 +427,17 @@ class DoubleNodDetector:
     spikes from normal head motion are not carried over.
     """
 
+    __slots__ = ('last_trigger_time', '_spike_start', '_suppressed', '_first_nod_time',
+                 '_threshold', '_max_duration', '_window')
+
     def __init__(self):
         self.last_trigger_time = -100.0
         self._spike_start = None
         self._suppressed = False
         self._first_nod_time = None  # When the first valid nod completed
+        self._threshold = config.DOUBLE_NOD_THRESHOLD
+        self._max_duration = config.DOUBLE_NOD_MAX_DURATION
+        self._window = config.DOUBLE_NOD_WINDOW
 
     def update(self, gx: int, now: float = None, cursor_frozen: bool = False) -> str | None:
         """
@@ -293,7 +445,7 @@ class DoubleNodDetector:
 
         Args:
             gx: Raw gyro_x value.
-            now: Current time (default: time.time()).
+            now: Current time (default: time.monotonic()).
             cursor_frozen: True when cursor is frozen (looking left/right).
                 Only processes nod detection when True.
 
@@ -301,22 +453,20 @@ class DoubleNodDetector:
             "center_cursor" if double nod detected, None otherwise.
         """
         if now is None:
-            now = time.time()
+            now = time.monotonic()
 
         if not cursor_frozen:
-            self._spike_start = None
-            self._suppressed = False
-            self._first_nod_time = None
+            self.disarm()
             return None
 
-        above = abs(gx) > config.DOUBLE_NOD_THRESHOLD
+        above = abs(gx) > self._threshold
 
         if above:
             if self._suppressed:
                 pass
             elif self._spike_start is None:
                 self._spike_start = now
-            elif now - self._spike_start > config.DOUBLE_NOD_MAX_DURATION:
+            elif now - self._spike_start > self._max_duration:
                 # Held too long — not a nod
                 self._spike_start = None
                 self._suppressed = True
@@ -328,10 +478,10 @@ class DoubleNodDetector:
                 duration = now - self._spike_start
                 self._spike_start = None
 
-                if duration <= config.DOUBLE_NOD_MAX_DURATION:
+                if duration <= self._max_duration:
                     if self._first_nod_time is not None:
                         # Second nod — check window and cooldown
-                        if (now - self._first_nod_time <= config.DOUBLE_NOD_WINDOW
+                        if (now - self._first_nod_time <= self._window
                                 and now - self.last_trigger_time > config.DOUBLE_NOD_COOLDOWN):
                             self._first_nod_time = None
                             self.last_trigger_time = now
@@ -346,11 +496,17 @@ class DoubleNodDetector:
 
             # Expire first nod if window passed
             if (self._first_nod_time is not None
-                    and now - self._first_nod_time > config.DOUBLE_NOD_WINDOW):
+                    and now - self._first_nod_time > self._window):
                 self._first_nod_time = None
 
         return None
 
+    def disarm(self):
+        """Drop any half-seen nod, keeping the trigger cooldown."""
+        self._spike_start = None
+        self._suppressed = False
+        self._first_nod_time = None
+
     def reset(self):
         self.last_trigger_time = -100.0
         self._spike_start = None
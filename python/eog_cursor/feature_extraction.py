@@ -4,85 +4,162 @@ Feature extraction for EOG signal classification.
 Extracts time-domain and statistical features from windowed EOG data
 for use with SVM classifier.
 
-Supports dual-channel EOG (eog_v + eog_h) via extract_dual_features().
+Supports dual-channel EOG (eog_v + eog_h) via extract_dual_features(), and
+whole stacks of windows at once via the *_batch() variants.
 """
 
+from functools import lru_cache
+
 import numpy as np
 
+from ._feature_loop import COMPILED as _LOOP_COMPILED, window_features as _window_features
+
+
+@lru_cache(maxsize=8)
+def _centered_ramp(n: int) -> np.ndarray:
+    """Sample index minus its mean, 0..n-1; the x axis of the slope fit."""
+    return np.arange(n) - (n - 1) / 2
 
-def extract_features(window: np.ndarray) -> np.ndarray:
+
+def extract_features(window: np.ndarray, out: np.ndarray = None,
+                     offset: int = 0) -> np.ndarray:
     """
     Extract classification features from an EOG signal window.
 
+    The window is tiny, so cost is NumPy call overhead rather than
+    arithmetic: the moments are taken from one centered copy, and the
+    slope is the closed-form least-squares fit against a cached index
+    ramp rather than np.polyfit.  Means and variances are written as
+    sum() / n and dot products, which skip the per-call setup of
+    ndarray.mean() and ndarray.var() (several microseconds each).
+
     Args:
         window: 1D array of EOG samples (typically 200 samples = 1.0s)
+        out: Optional float array to write the features into instead of
+            allocating a new one
+        offset: Index in `out` of the first feature
 
     Returns:
-        Feature vector (1D numpy array)
+        Feature vector (1D numpy array), or `out` if it was given
     """
-    features = []
+    window = np.asarray(window, dtype=float)
+    n = len(window)
 
-    # Cache common statistics (avoid redundant computation)
-    mean = np.mean(window)
-    std = np.std(window)
+    if _LOOP_COMPILED and n:
+        # Compiled build: one C loop instead of a dozen small NumPy calls
+        if out is None:
+            out = np.empty(len(FEATURE_NAMES))
+        _window_features(np.ascontiguousarray(window), out, offset)
+        return out
+
+    mean = window.sum() / n
     centered = window - mean
-    derivative = np.diff(window)
+    c2 = centered * centered
+    var = c2.sum() / n
+    std = np.sqrt(var)
+    derivative = window[1:] - window[:-1]
 
     # --- Time-domain features ---
 
     # Peak-to-peak amplitude
-    peak_amplitude = np.max(window) - np.min(window)
-    features.append(peak_amplitude)
+    peak_amplitude = window.max() - window.min()
 
     # Zero-crossing rate (after mean subtraction)
-    zero_crossings = np.sum(np.diff(np.sign(centered)) != 0)
-    features.append(zero_crossings)
+    sign = np.sign(centered)
+    zero_crossings = np.count_nonzero(sign[1:] != sign[:-1])
 
-    # Linear slope (trend direction)
-    x = np.arange(len(window))
-    slope = np.polyfit(x, window, 1)[0]
-    features.append(slope)
+    # Linear slope (trend direction): cov(x, y) / var(x)
+    if n > 1:
+        slope = _centered_ramp(n) @ window * 12.0 / (n * (n * n - 1))
+    else:
+        slope = 0.0
 
     # Maximum absolute derivative (speed of change)
-    max_derivative = np.max(np.abs(derivative)) if len(derivative) > 0 else 0
-    features.append(max_derivative)
+    max_derivative = np.abs(derivative).max() if n > 1 else 0
 
     # --- Statistical features ---
 
-    # Mean
-    features.append(mean)
-
-    # Standard deviation
-    features.append(std)
-
-    # Skewness (asymmetry)
+    # Skewness (asymmetry) and kurtosis (peakedness)
     if std > 0:
-        skewness = np.mean((centered / std) ** 3)
+        skewness = (c2 @ centered) / n / (var * std)
+        kurtosis = (c2 @ c2) / n / (var * var) - 3
     else:
         skewness = 0.0
-    features.append(skewness)
-
-    # Kurtosis (peakedness)
-    if std > 0:
-        kurtosis = np.mean((centered / std) ** 4) - 3
-    else:
         kurtosis = 0.0
-    features.append(kurtosis)
 
     # --- Energy features ---
 
     # Root mean square
-    rms = np.sqrt(np.mean(window ** 2))
-    features.append(rms)
+    rms = np.sqrt(var + mean * mean)
 
     # Variance of derivative (signal "roughness")
-    if len(derivative) > 0:
-        deriv_var = np.var(derivative)
+    if n > 1:
+        d_centered = derivative - derivative.sum() / (n - 1)
+        deriv_var = d_centered @ d_centered / (n - 1)
     else:
         deriv_var = 0.0
-    features.append(deriv_var)
 
-    return np.array(features)
+    features = (
+        peak_amplitude, zero_crossings, slope, max_derivative,
+        mean, std, skewness, kurtosis, rms, deriv_var,
+    )
+    if out is None:
+        return np.array(features, dtype=float)
+    out[offset:offset + len(features)] = features
+    return out
+
+
+def extract_features_batch(windows: np.ndarray) -> np.ndarray:
+    """
+    Extract features for many windows at once.
+
+    Row i of the result equals extract_features(windows[i]) (to float
+    rounding); every step runs once along axis 1 instead of once per
+    window, which is what makes offline feature extraction over a whole
+    recording cheap.
+
+    Args:
+        windows: 2D array of shape (num_windows, window_size)
+
+    Returns:
+        Feature matrix of shape (num_windows, len(FEATURE_NAMES))
+    """
+    windows = np.asarray(windows, dtype=float)
+    num_windows, n = windows.shape
+
+    mean = windows.sum(axis=1) / n
+    centered = windows - mean[:, None]
+    c2 = centered * centered
+    var = c2.sum(axis=1) / n
+    std = np.sqrt(var)
+    derivative = np.diff(windows, axis=1)
+
+    peak_amplitude = windows.max(axis=1) - windows.min(axis=1)
+
+    sign = np.sign(centered)
+    zero_crossings = np.count_nonzero(sign[:, 1:] != sign[:, :-1], axis=1)
+
+    if n > 1:
+        slope = windows @ _centered_ramp(n) * (12.0 / (n * (n * n - 1)))
+        max_derivative = np.abs(derivative).max(axis=1)
+        deriv_var = derivative.var(axis=1)
+    else:
+        slope = max_derivative = deriv_var = np.zeros(num_windows)
+
+    # Flat windows get zero skewness/kurtosis, as in extract_features()
+    flat = std == 0
+    safe_var = np.where(flat, 1.0, var)
+    skewness = np.where(flat, 0.0, (c2 * centered).sum(axis=1) / n
+                        / (safe_var * np.sqrt(safe_var)))
+    kurtosis = np.where(flat, 0.0, (c2 * c2).sum(axis=1) / n
+                        / (safe_var * safe_var) - 3)
+
+    rms = np.sqrt(var + mean * mean)
+
+    return np.column_stack([
+        peak_amplitude, zero_crossings, slope, max_derivative,
+        mean, std, skewness, kurtosis, rms, deriv_var,
+    ]).astype(float, copy=False)
 
 
 # Feature names for reference and model interpretation
@@ -101,7 +178,8 @@ FEATURE_NAMES = [
 
 
 def extract_dual_features(eog_v_window: np.ndarray,
-                           eog_h_window: np.ndarray) -> np.ndarray:
+                           eog_h_window: np.ndarray,
+                           out: np.ndarray = None) -> np.ndarray:
     """
     Extract features from both vertical and horizontal EOG channels.
 
@@ -112,13 +190,33 @@ def extract_dual_features(eog_v_window: np.ndarray,
     Args:
         eog_v_window: 1D array of vertical EOG samples
         eog_h_window: 1D array of horizontal EOG samples
+        out: Optional length-20 float array to fill in place (both
+            channels write straight into it, no per-channel arrays)
 
     Returns:
         Feature vector of length 20 (10 per channel)
     """
-    feats_v = extract_features(eog_v_window)
-    feats_h = extract_features(eog_h_window)
-    return np.concatenate([feats_v, feats_h])
+    if out is None:
+        out = np.empty(2 * len(FEATURE_NAMES))
+    extract_features(eog_v_window, out, 0)
+    extract_features(eog_h_window, out, len(FEATURE_NAMES))
+    return out
+
+
+def extract_dual_features_batch(windows_v: np.ndarray,
+                                 windows_h: np.ndarray) -> np.ndarray:
+    """
+    Batch form of extract_dual_features().
+
+    Args:
+        windows_v: 2D array (num_windows, window_size) of vertical EOG
+        windows_h: 2D array (num_windows, window_size) of horizontal EOG
+
+    Returns:
+        Feature matrix of shape (num_windows, 20)
+    """
+    return np.hstack([extract_features_batch(windows_v),
+                      extract_features_batch(windows_h)])
 
 
 DUAL_FEATURE_NAMES = (
@@ -23,6 +23,14 @@ from .event_detector import BlinkDetector, GazeDetector, HorizontalGazeDetector
 
 logger = logging.getLogger(__name__)
 
+# Gaze keys → key-state attribute they hold
+_GAZE_KEYS = {
+    'u': '_look_up',
+    'd': '_look_down',
+    'l': '_look_left',
+    'r': '_look_right',
+}
+
 
 class KeyboardOverlay:
     """Injects discrete EOG events from keyboard alongside hardware input.
@@ -35,6 +43,7 @@ class KeyboardOverlay:
 
     def __init__(self):
         self._listener = None
+        self._space_key = None  # pynput Key.space, bound in start()
 
         # Independent detectors — separate from the hardware-fed ones
         self._blink_detector = BlinkDetector()
@@ -54,8 +63,9 @@ class KeyboardOverlay:
 
     def start(self):
         """Start background keyboard listener."""
-        from pynput.keyboard import Listener
+        from pynput.keyboard import Key, Listener
 
+        self._space_key = Key.space
         self._listener = Listener(
             on_press=self._on_press,
             on_release=self._on_release,
@@ -75,42 +85,18 @@ class KeyboardOverlay:
     # ------------------------------------------------------------------
 
     def _on_press(self, key):
-        try:
-            from pynput.keyboard import Key
-            if key == Key.space:
-                self._space_pressed = True
-        except AttributeError:
-            pass
-
-        if hasattr(key, 'char') and key.char:
-            c = key.char
-            if c == 'u':
-                self._look_up = True
-            elif c == 'd':
-                self._look_down = True
-            elif c == 'l':
-                self._look_left = True
-            elif c == 'r':
-                self._look_right = True
+        self._set_key(key, True)
 
     def _on_release(self, key):
-        try:
-            from pynput.keyboard import Key
-            if key == Key.space:
-                self._space_pressed = False
-        except AttributeError:
-            pass
-
-        if hasattr(key, 'char') and key.char:
-            c = key.char
-            if c == 'u':
-                self._look_up = False
-            elif c == 'd':
-                self._look_down = False
-            elif c == 'l':
-                self._look_left = False
-            elif c == 'r':
-                self._look_right = False
+        self._set_key(key, False)
+
+    def _set_key(self, key, pressed: bool):
+        if key == self._space_key:
+            self._space_pressed = pressed
+            return
+        attr = _GAZE_KEYS.get(getattr(key, 'char', None))
+        if attr is not None:
+            setattr(self, attr, pressed)
 
     # ------------------------------------------------------------------
     # Polling
@@ -8,15 +8,19 @@ long_blink, look_up, look_down, look_left, look_right.
 
 import logging
 import os
+import threading
 
 import joblib
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.preprocessing import StandardScaler
 from sklearn.svm import SVC
 
 from . import config
-from .feature_extraction import extract_dual_features
-from .signal_processing import SlidingWindow
+from .feature_extraction import (
+    DUAL_FEATURE_NAMES, extract_dual_features, extract_dual_features_batch,
+)
+from .signal_processing import SensorRing
 
 logger = logging.getLogger(__name__)
 
@@ -27,16 +31,42 @@ class EOGClassifier:
 
     Operates on sliding windows of EOG data, extracting features
     and classifying into event types.
+
+    With background=True, predict() only buffers samples: each full
+    window is copied and classified on a daemon thread, so a slow
+    prediction never holds up the sensor loop.  If the worker is still
+    busy when the next window is due, the older unclassified window is
+    dropped.  Finished labels come back from a later predict() call.
     """
 
-    def __init__(self, model_path=None, scaler_path=None):
+    def __init__(self, model_path=None, scaler_path=None, background=False):
         self.model_path = model_path or config.ML_MODEL_PATH
         self.scaler_path = scaler_path or config.ML_SCALER_PATH
         self.model = None
         self.scaler = None
-        self.window_v = SlidingWindow(config.ML_WINDOW_SIZE)
-        self.window_h = SlidingWindow(config.ML_WINDOW_SIZE)
+        self.window = SensorRing(2, config.ML_WINDOW_SIZE)  # rows: eog_v, eog_h
         self._step_counter = 0
+        # Samples not yet written to the ring: predict() only needs the
+        # window every ML_WINDOW_STEP samples, so it is filled one block
+        # at a time instead of with a two-column push per sample
+        self._queued_v = []
+        self._queued_h = []
+        # Reused (1, 20) feature row: filled in place on every prediction
+        self._features = np.empty((1, len(DUAL_FEATURE_NAMES)))
+        # StandardScaler parameters, applied directly in predict()
+        self._scale_mean = None
+        self._scale_std = None
+        # RBF one-vs-one decision terms, see _unpack_svc()
+        self._svc = None
+
+        self.background = background
+        if background:
+            self._pending = None  # newest window not yet classified
+            self._label = None    # finished label not yet returned
+            self._lock = threading.Lock()
+            self._wake = threading.Event()
+            self._thread = threading.Thread(target=self._work, name="ml-classifier", daemon=True)
+            self._thread.start()
 
     def load(self) -> bool:
         """
@@ -54,6 +84,16 @@ class EOGClassifier:
 
         self.model = joblib.load(self.model_path)
         self.scaler = joblib.load(self.scaler_path)
+        # Only mean_ and scale_ matter at inference; a fitted scaler stores
+        # None for whichever step it skips (with_mean / with_std=False)
+        n_features = len(DUAL_FEATURE_NAMES)
+        mean = getattr(self.scaler, "mean_", None)
+        scale = getattr(self.scaler, "scale_", None)
+        self._scale_mean = (np.zeros(n_features) if mean is None
+                            else np.asarray(mean, dtype=np.float64))
+        self._scale_std = (np.ones(n_features) if scale is None
+                           else np.asarray(scale, dtype=np.float64))
+        self._svc = _unpack_svc(self.model)
         logger.info("ML model loaded successfully.")
         return True
 
@@ -63,7 +103,8 @@ class EOGClassifier:
         Feed one dual-channel EOG sample and get classification result.
 
         Returns a class label every ML_WINDOW_STEP samples after
-        the window is full, otherwise None.
+        the window is full, otherwise None.  In background mode the label
+        is returned by the first call after the worker has finished it.
 
         Args:
             eog_v_sample: Vertical EOG value
@@ -72,32 +113,198 @@ class EOGClassifier:
         if eog_h_sample is None:
             eog_h_sample = float(config.EOG_BASELINE)
 
-        self.window_v.push(eog_v_sample)
-        self.window_h.push(eog_h_sample)
+        self._queued_v.append(eog_v_sample)
+        self._queued_h.append(eog_h_sample)
         self._step_counter += 1
 
-        if not self.window_v.is_full():
-            return None
+        if (self._step_counter >= config.ML_WINDOW_STEP
+                and self.window.count + len(self._queued_v) >= self.window.size):
+            self._step_counter = 0
+            self.window.extend(self._queued_v, self._queued_h)
+            self._queued_v.clear()
+            self._queued_h.clear()
+            if not self.background:
+                window_v, window_h = self.window.window()
+                return self._classify(window_v, window_h)
+            # Copy: the ring keeps moving while the worker classifies
+            snapshot = self.window.window().copy()
+            with self._lock:
+                self._pending = snapshot
+            self._wake.set()
 
-        if self._step_counter < config.ML_WINDOW_STEP:
+        if not self.background:
             return None
+        with self._lock:
+            label, self._label = self._label, None
+        return label
 
-        self._step_counter = 0
-
+    def _classify(self, window_v: np.ndarray, window_h: np.ndarray) -> str:
+        """Classify one dual-channel window."""
         # Extract dual-channel features
-        features = extract_dual_features(
-            self.window_v.get(), self.window_h.get()
-        )
-        features = features.reshape(1, -1)
+        features = self._features
+        extract_dual_features(window_v, window_h, out=features[0])
 
-        # Scale features
-        if self.scaler:
-            features = self.scaler.transform(features)
+        # Scale features in place: the same arithmetic as
+        # StandardScaler.transform() without sklearn's per-call validation
+        if self._scale_mean is not None:
+            np.subtract(features, self._scale_mean, out=features)
+            np.divide(features, self._scale_std, out=features)
 
         # Predict
+        if self._svc is not None:
+            return _svc_predict_row(features[0], *self._svc)
         label = self.model.predict(features)[0]
         return label
 
+    def _work(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                window, self._pending = self._pending, None
+            if window is None:
+                continue
+            try:
+                label = self._classify(window[0], window[1])
+            except Exception as e:
+                logger.warning(f"ML prediction failed: {e}")
+                continue
+            with self._lock:
+                self._label = label
+
+    def predict_windows(self, windows_v: np.ndarray,
+                        windows_h: np.ndarray) -> np.ndarray:
+        """
+        Classify a stack of windows with one scaler and one SVM call.
+
+        sklearn's per-call overhead dwarfs the kernel work for a single
+        20-feature row, so classifying many windows together is far
+        cheaper than calling predict() once per window.
+
+        Args:
+            windows_v: 2D array (num_windows, window_size) of vertical EOG
+            windows_h: 2D array (num_windows, window_size) of horizontal EOG
+
+        Returns:
+            Array of class labels, one per window
+        """
+        features = extract_dual_features_batch(windows_v, windows_h)
+        if self.scaler:
+            features = self.scaler.transform(features)
+        return self.model.predict(features)
+
+    def predict_recording(self, eog_v: np.ndarray,
+                          eog_h: np.ndarray) -> list:
+        """
+        Classify a whole recording up front.
+
+        Returns one entry per sample: the label predict() would return if
+        the samples were streamed through a freshly created classifier,
+        i.e. None except every ML_WINDOW_STEP samples once the first
+        window is full.  All windows go through predict_windows() at once.
+
+        Args:
+            eog_v: 1D array of raw vertical EOG samples
+            eog_h: 1D array of raw horizontal EOG samples
+        """
+        size = self.window.size
+        step = config.ML_WINDOW_STEP
+        n = len(eog_v)
+        results = [None] * n
+
+        # predict() fires first when the window fills (or the step counter
+        # reaches ML_WINDOW_STEP, if that is later), then every step samples
+        first = max(size, step) - 1
+        if n <= first:
+            return results
+        ends = np.arange(first, n, step)
+        starts = ends - (size - 1)
+        windows_v = sliding_window_view(np.asarray(eog_v, dtype=float), size)[starts]
+        windows_h = sliding_window_view(np.asarray(eog_h, dtype=float), size)[starts]
+
+        labels = self.predict_windows(windows_v, windows_h)
+        for end, label in zip(ends.tolist(), labels.tolist()):
+            results[end] = label
+        return results
+
+
+def _unpack_svc(model):
+    """
+    Pull the arrays an RBF SVC needs at inference out of a fitted model.
+
+    Returns (support_vectors, weights, intercept, gamma, pair_i, pair_j,
+    classes) for _svc_predict_row(), or None when the model is anything
+    but a default-shaped RBF SVC (break_ties set, decision shape other
+    than "ovr", or no resolvable gamma), so callers fall back to
+    model.predict().  weights holds one row per one-vs-one class pair
+    (i, j), with each pair's dual coefficients scattered over the
+    columns of its two classes' support vectors, so every pairwise
+    decision value comes out of a single matrix-vector product.
+    """
+    if (not isinstance(model, SVC) or model.kernel != "rbf"
+            or model.break_ties or model.decision_function_shape != "ovr"):
+        return None
+    gamma = _svc_gamma(model)
+    if gamma is None:
+        return None
+
+    classes = model.classes_
+    n_classes = len(classes)
+    sv = np.asarray(model.support_vectors_, dtype=np.float64)
+    coef = np.asarray(model.dual_coef_, dtype=np.float64)
+    intercept = np.asarray(model.intercept_, dtype=np.float64)
+    if n_classes == 2:
+        # sklearn flips the sign of both for binary problems; undo it to
+        # get libsvm's own convention, which the vote below follows
+        coef = -coef
+        intercept = -intercept
+
+    bounds = np.concatenate(([0], np.cumsum(model.n_support_)))
+    pairs = [(i, j) for i in range(n_classes) for j in range(i + 1, n_classes)]
+    weights = np.zeros((len(pairs), len(sv)))
+    for p, (i, j) in enumerate(pairs):
+        si = slice(bounds[i], bounds[i + 1])
+        sj = slice(bounds[j], bounds[j + 1])
+        weights[p, si] = coef[j - 1, si]
+        weights[p, sj] = coef[i, sj]
+
+    pair_i = np.array([i for i, _ in pairs])
+    pair_j = np.array([j for _, j in pairs])
+    return sv, weights, intercept, gamma, pair_i, pair_j, classes
+
+
+def _svc_gamma(model):
+    """
+    The RBF gamma a fitted SVC uses, or None if it cannot be determined.
+
+    Numeric and "auto" gammas resolve from public attributes.  "scale"
+    depends on the training data's variance, which sklearn only keeps in
+    the private _gamma, so that is read defensively.
+    """
+    if model.gamma == "auto":
+        return 1.0 / model.n_features_in_
+    if model.gamma == "scale":
+        gamma = getattr(model, "_gamma", None)
+        return None if gamma is None else float(gamma)
+    return float(model.gamma)
+
+
+def _svc_predict_row(x, sv, weights, intercept, gamma, pair_i, pair_j, classes):
+    """
+    Classify one scaled feature row the way libsvm does.
+
+    Each pair (i, j) votes for class i when its decision value is
+    positive, otherwise for j; the most-voted class wins, ties going to
+    the lower class index.  Equivalent to SVC.predict() on a single row
+    without sklearn's per-call validation and dispatch.
+    """
+    diff = sv - x
+    kernel = np.exp(np.einsum("ij,ij->i", diff, diff) * -gamma)
+    decision = weights @ kernel + intercept
+    winners = np.where(decision > 0, pair_i, pair_j)
+    votes = np.bincount(winners, minlength=len(classes))
+    return classes[votes.argmax()]
+
 
 def train_model(X: np.ndarray, y: np.ndarray,
                 save_dir: str = "python/models") -> tuple[SVC, StandardScaler]:
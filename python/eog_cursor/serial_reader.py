@@ -7,20 +7,26 @@ into structured data packets.
 
 import logging
 import time
-from dataclasses import dataclass
+from typing import NamedTuple
 
 from . import config
 
 logger = logging.getLogger(__name__)
 
+# Longest plausible CSV line; stream() drops unterminated data beyond this
+_MAX_LINE_BYTES = 256
 
-@dataclass
-class SensorPacket:
+
+class SensorPacket(NamedTuple):
     """Single data packet from STM32.
 
     Contains dual-channel EOG data:
       eog_v: vertical   EOG channel (12-bit ADC, 0-4095)
       eog_h: horizontal EOG channel (12-bit ADC, 0-4095)
+
+    A NamedTuple rather than a dataclass: one is built per sample, and a
+    tuple has no per-instance __dict__ and supports fast positional
+    construction.
     """
     timestamp: int      # ms since STM32 boot
     eog_v: int          # 12-bit ADC value, vertical EOG channel
@@ -28,7 +34,7 @@ class SensorPacket:
     gyro_x: int         # Raw gyroscope X
     gyro_y: int         # Raw gyroscope Y
     gyro_z: int         # Raw gyroscope Z
-    pc_time: float      # PC-side timestamp (time.time())
+    pc_time: float      # PC-side timestamp (time.monotonic())
 
 
 class SerialReader:
@@ -72,56 +78,75 @@ class SerialReader:
         if not self.ser or not self.ser.is_open:
             raise ConnectionError("Serial port not connected")
 
-        try:
-            raw_line = self.ser.readline()
-            if not raw_line:
-                return None
-
-            line = raw_line.decode("ascii", errors="ignore").strip()
-            if not line:
-                return None
+        raw_line = self.ser.readline()
+        if not raw_line:
+            return None
+        return self._parse_line(raw_line)
 
-            parts = line.split(",")
+    def _parse_line(self, raw_line: bytes) -> SensorPacket | None:
+        """Parse one raw CSV line; None (counted as an error if not blank) if malformed."""
+        try:
+            # Parse straight from bytes: int() accepts ASCII digits with
+            # surrounding whitespace, so no decode/strip pass is needed
+            parts = raw_line.split(b",")
             if len(parts) == 6:
                 # Dual-channel: timestamp,eog_v,eog_h,gx,gy,gz
                 return SensorPacket(
-                    timestamp=int(parts[0]),
-                    eog_v=int(parts[1]),
-                    eog_h=int(parts[2]),
-                    gyro_x=int(parts[3]),
-                    gyro_y=int(parts[4]),
-                    gyro_z=int(parts[5]),
-                    pc_time=time.time()
+                    int(parts[0]), int(parts[1]), int(parts[2]),
+                    int(parts[3]), int(parts[4]), int(parts[5]),
+                    time.monotonic(),
                 )
             elif len(parts) == 5:
                 # Legacy single-channel: timestamp,eog_v,gx,gy,gz
                 return SensorPacket(
-                    timestamp=int(parts[0]),
-                    eog_v=int(parts[1]),
-                    eog_h=config.EOG_BASELINE,
-                    gyro_x=int(parts[2]),
-                    gyro_y=int(parts[3]),
-                    gyro_z=int(parts[4]),
-                    pc_time=time.time()
+                    int(parts[0]), int(parts[1]), config.EOG_BASELINE,
+                    int(parts[2]), int(parts[3]), int(parts[4]),
+                    time.monotonic(),
                 )
-            else:
-                self._error_count += 1
-                if self._error_count % 100 == 1:
-                    logger.warning(f"Malformed line ({self._error_count} total): {line!r}")
+
+            line = raw_line.decode("ascii", errors="ignore").strip()
+            if not line:
                 return None
+            self._error_count += 1
+            if self._error_count % 100 == 1:
+                logger.warning(f"Malformed line ({self._error_count} total): {line!r}")
+            return None
 
-        except (ValueError, UnicodeDecodeError) as e:
+        except ValueError as e:
             self._error_count += 1
             if self._error_count % 100 == 1:
                 logger.warning(f"Parse error ({self._error_count} total): {e}")
             return None
 
     def stream(self):
-        """Generator that yields SensorPackets continuously."""
+        """
+        Generator that yields SensorPackets continuously.
+
+        Reads everything the port has buffered in one call (blocking for at
+        least one byte, up to the serial timeout) and parses every complete
+        line in it, so pyserial's per-call overhead is paid once per burst
+        rather than once per packet.  A trailing partial line is carried
+        over to the next read.
+        """
+        if not self.ser or not self.ser.is_open:
+            raise ConnectionError("Serial port not connected")
+
+        ser = self.ser
+        pending = b""
         while True:
-            packet = self.read_packet()
-            if packet is not None:
-                yield packet
+            chunk = ser.read(ser.in_waiting or 1)
+            if not chunk:
+                continue
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            if len(pending) > _MAX_LINE_BYTES:
+                # No newline in sight: line noise, not a packet
+                self._parse_line(pending)
+                pending = b""
+            for line in lines:
+                packet = self._parse_line(line)
+                if packet is not None:
+                    yield packet
 
     def __enter__(self):
         self.connect()
@@ -0,0 +1,56 @@
+# Cython declarations for signal_processing.py (pure-Python mode).
+#
+# Only read by `EOG_CURSOR_COMPILE=1 pip install .` (see setup.py): the
+# per-packet filters become extension types with C-typed fields, and the
+# arithmetic in filter_sample() and update() runs on C doubles, so the
+# live loop's low-pass and gyro correction steps skip the instance
+# __dict__ and float boxing.  Fields holding arrays, lists or None stay
+# `object`.  Everything is `public` so the pure-Python and compiled builds
+# expose the same attributes.  The window buffers stay ordinary classes.
+
+cimport cython
+
+cdef class EOGLowPassFilter:
+    cdef public object sos
+    cdef public object _zi_template
+    cdef public object _coeffs
+    cdef public object zi
+
+    @cython.locals(x=double, y=double, b0=double, b1=double, b2=double,
+                   a1=double, a2=double)
+    cpdef filter_sample(self, double sample)
+
+
+cdef class GyroCalibrator:
+    cdef public int num_samples
+    cdef public int discard
+    cdef public double bias_x
+    cdef public double bias_y
+    cdef public double bias_z
+    cdef public bint calibrated
+
+
+cdef class GyroKalmanFilter:
+    cdef public double q_omega
+    cdef public double q_bias
+    cdef public double r
+    cdef public double omega
+    cdef public double bias
+    cdef public double p00
+    cdef public double p01
+    cdef public double p10
+    cdef public double p11
+
+
+cdef class GyroKalmanFilter3Axis:
+    cdef public double q_omega
+    cdef public double q_bias
+    cdef public double r
+    cdef public double bias_x
+    cdef public double bias_y
+    cdef public double bias_z
+    cdef public double p_bias
+
+    @cython.locals(p_pred=double, s=double, k_omega=double, k_bias=double,
+                   yx=double, yy=double, yz=double)
+    cpdef update(self, double gx, double gy, double gz)
@@ -7,7 +7,6 @@ gyro bias calibration, and Kalman filtering for gyro drift.
 """
 
 import numpy as np
-from scipy.signal import butter, sosfilt, sosfilt_zi
 
 from . import config
 
@@ -23,9 +22,18 @@ class EOGLowPassFilter:
 
     Uses Butterworth IIR filter with second-order sections (SOS)
     for numerical stability.
+
+    filter_sample() runs the biquad recurrence in plain Python floats:
+    a sosfilt call costs microseconds of argument handling for the dozen
+    multiply-adds one sample needs.  filter_array() still uses sosfilt,
+    and both share the same per-section state.
     """
 
     def __init__(self, cutoff=None, fs=None, order=None):
+        # scipy.signal is imported on first use: it dominates import time,
+        # and `main.py --help` or a bad --port should not wait for it
+        from scipy.signal import butter, sosfilt_zi
+
         cutoff = cutoff or config.EOG_LOWPASS_CUTOFF
         fs = fs or config.SAMPLE_RATE
         order = order or config.EOG_LOWPASS_ORDER
@@ -34,17 +42,45 @@ class EOGLowPassFilter:
         normalized_cutoff = cutoff / nyquist
         self.sos = butter(order, normalized_cutoff, btype="low", output="sos")
         self._zi_template = sosfilt_zi(self.sos)
-        self.zi = None  # Scaled on first sample
+        # Per-section (b0, b1, b2, a1, a2); a0 is 1 in butter's SOS output
+        self._coeffs = [tuple(row) for row in self.sos[:, [0, 1, 2, 4, 5]].tolist()]
+        self.zi = None  # Per-section [z0, z1] lists; scaled on first sample
 
     def filter_sample(self, sample: float) -> float:
         """Filter a single sample, maintaining internal state."""
-        if self.zi is None:
+        zi = self.zi
+        if zi is None:
             # Scale initial conditions by first sample to avoid startup transient.
             # sosfilt_zi returns steady-state zi for input=1.0; multiplying by the
             # actual first sample makes the filter start at the correct DC level.
-            self.zi = self._zi_template * sample
-        filtered, self.zi = sosfilt(self.sos, [sample], zi=self.zi)
-        return filtered[0]
+            zi = self.zi = (self._zi_template * sample).tolist()
+        # Transposed direct form II, section by section (same order as sosfilt)
+        x = sample
+        for (b0, b1, b2, a1, a2), z in zip(self._coeffs, zi):
+            y = b0 * x + z[0]
+            z[0] = b1 * x - a1 * y + z[1]
+            z[1] = b2 * x - a2 * y
+            x = y
+        return x
+
+    def filter_array(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Filter a block of samples in one call, carrying state like filter_sample().
+
+        Output is identical to feeding the samples one at a time, so offline
+        replay sees exactly what the live loop would. (Zero-phase sosfiltfilt
+        is deliberately not used: it is non-causal and would shift events
+        relative to the live pipeline.)
+        """
+        from scipy.signal import sosfilt
+
+        samples = np.asarray(samples, dtype=float)
+        if len(samples) == 0:
+            return samples
+        zi = self._zi_template * samples[0] if self.zi is None else np.array(self.zi)
+        filtered, zi = sosfilt(self.sos, samples, zi=zi)
+        self.zi = zi.tolist()
+        return filtered
 
     def reset(self):
         """Reset filter state (re-initializes on next sample)."""
@@ -75,24 +111,26 @@ class GyroCalibrator:
         The device must be stationary during this period.
         Returns (bias_x, bias_y, bias_z).
         """
-        samples_x = []
-        samples_y = []
-        samples_z = []
+        # Running integer sums: O(1) memory, exact for any realistic count
+        sx = sy = sz = 0
+        n = 0
         count = 0
 
         for packet in source.stream():
             count += 1
             if count <= self.discard:
                 continue
-            samples_x.append(packet.gyro_x)
-            samples_y.append(packet.gyro_y)
-            samples_z.append(packet.gyro_z)
-            if len(samples_x) >= self.num_samples:
+            sx += packet.gyro_x
+            sy += packet.gyro_y
+            sz += packet.gyro_z
+            n += 1
+            if n >= self.num_samples:
                 break
 
-        self.bias_x = float(np.mean(samples_x))
-        self.bias_y = float(np.mean(samples_y))
-        self.bias_z = float(np.mean(samples_z))
+        if n:
+            self.bias_x = sx / n
+            self.bias_y = sy / n
+            self.bias_z = sz / n
         self.calibrated = True
         return self.bias_x, self.bias_y, self.bias_z
 
@@ -104,6 +142,18 @@ class GyroCalibrator:
             int(round(gz - self.bias_z)),
         )
 
+    def correct_array(self, gx, gy, gz):
+        """
+        Subtract bias from whole gyro columns at once.
+
+        Element-for-element identical to correct(): np.rint rounds half to
+        even like round().  Returns three int64 arrays.
+        """
+        return tuple(
+            np.rint(np.asarray(g) - bias).astype(np.int64)
+            for g, bias in ((gx, self.bias_x), (gy, self.bias_y), (gz, self.bias_z))
+        )
+
 
 class GyroKalmanFilter:
     """
@@ -118,39 +168,36 @@ class GyroKalmanFilter:
     velocity changes quickly (large Q_omega). When the gyro reads a
     sustained offset, the filter gradually attributes it to bias drift
     rather than real motion — no explicit stillness detection needed.
+
+    Matrices: F = [[0, 0], [0, 1]], H = [1, 1], Q = diag(Q_omega, Q_bias),
+    R = [r].  They are constant and sparse, so update() writes the
+    predict/update products out as scalar arithmetic over the two state
+    entries and four covariance entries; 2x2 NumPy products would spend
+    microseconds on dispatch for a few dozen flops.
     """
 
     def __init__(self, q_omega=None, q_bias=None, r=None):
-        q_omega = q_omega if q_omega is not None else config.KALMAN_Q_OMEGA
-        q_bias = q_bias if q_bias is not None else config.KALMAN_Q_BIAS
-        r = r if r is not None else config.KALMAN_R
-
-        # State vector [omega, bias]
-        self.x = np.array([0.0, 0.0])
+        self.q_omega = q_omega if q_omega is not None else config.KALMAN_Q_OMEGA
+        self.q_bias = q_bias if q_bias is not None else config.KALMAN_Q_BIAS
+        self.r = r if r is not None else config.KALMAN_R
 
-        # State covariance
-        self.P = np.array([
-            [1000.0, 0.0],
-            [0.0, 1000.0],
-        ])
+        # State [omega, bias]
+        self.omega = 0.0
+        self.bias = 0.0
 
-        # State transition: omega has no memory, bias persists
-        self.F = np.array([
-            [0.0, 0.0],
-            [0.0, 1.0],
-        ])
+        # State covariance [[p00, p01], [p10, p11]]
+        self.p00, self.p01 = 1000.0, 0.0
+        self.p10, self.p11 = 0.0, 1000.0
 
-        # Process noise
-        self.Q = np.array([
-            [q_omega, 0.0],
-            [0.0, q_bias],
-        ])
+    @property
+    def x(self) -> np.ndarray:
+        """State vector [omega, bias] (a copy)."""
+        return np.array([self.omega, self.bias])
 
-        # Measurement matrix: z = omega + bias
-        self.H = np.array([[1.0, 1.0]])
-
-        # Measurement noise
-        self.R = np.array([[r]])
+    @property
+    def P(self) -> np.ndarray:
+        """State covariance (a copy)."""
+        return np.array([[self.p00, self.p01], [self.p10, self.p11]])
 
     def update(self, z: float) -> float:
         """
@@ -163,32 +210,35 @@ class GyroKalmanFilter:
             Estimated true angular velocity (bias removed)
         """
         # --- Predict ---
-        x_pred = self.F @ self.x
-        P_pred = self.F @ self.P @ self.F.T + self.Q
+        # x- = F x = [0, bias];  P- = F P F^T + Q = diag(Q_omega, p11 + Q_bias)
+        q_omega = self.q_omega
+        p_bias = self.p11 + self.q_bias
 
         # --- Update ---
-        # Innovation
-        y = z - (self.H @ x_pred)[0]
-
-        # Innovation covariance
-        S = (self.H @ P_pred @ self.H.T + self.R)[0, 0]
+        # Innovation y = z - H x-, covariance S = H P- H^T + R
+        y = z - self.bias
+        s = q_omega + p_bias + self.r
 
-        # Kalman gain
-        K = (P_pred @ self.H.T) / S  # (2,1)
+        # Kalman gain K = P- H^T / S
+        k0 = q_omega / s
+        k1 = p_bias / s
 
-        # State update
-        self.x = x_pred + K.flatten() * y
+        # State update x = x- + K y
+        self.omega = k0 * y
+        self.bias += k1 * y
 
-        # Covariance update
-        I = np.eye(2)
-        self.P = (I - K @ self.H) @ P_pred
+        # Covariance update P = (I - K H) P-
+        self.p00 = (1.0 - k0) * q_omega
+        self.p01 = -k0 * p_bias
+        self.p10 = -k1 * q_omega
+        self.p11 = (1.0 - k1) * p_bias
 
         # Return estimated angular velocity (state[0])
-        return self.x[0]
+        return self.omega
 
     def get_bias(self) -> float:
         """Return current bias estimate."""
-        return self.x[1]
+        return self.bias
 
     def set_initial_bias(self, bias: float):
         """
@@ -197,30 +247,45 @@ class GyroKalmanFilter:
         Gives the filter a head start so it doesn't need to converge
         from zero during the first few seconds.
         """
-        self.x[1] = bias
+        self.bias = float(bias)
         # Reduce bias uncertainty since we have a calibration estimate
-        self.P[1, 1] = 100.0
+        self.p11 = 100.0
 
 
 class GyroKalmanFilter3Axis:
     """
-    Three independent Kalman filters for gyro X, Y, Z axes.
-
-    Convenience wrapper that applies GyroKalmanFilter to each axis
-    and returns corrected (gx, gy, gz) tuple matching the interface
-    of GyroCalibrator.correct().
+    Kalman bias tracking for gyro X, Y, Z as one 3-lane update.
+
+    Same model as GyroKalmanFilter on each axis, returning a corrected
+    (gx, gy, gz) tuple matching the interface of GyroCalibrator.correct().
+
+    With F = [[0, 0], [0, 1]] the predicted covariance is always
+    diag(Q_omega, p_bias + Q_bias) (see docs/kalman_filter.md), so the
+    2x2 algebra reduces to scalars. The covariance recursion does not
+    depend on the measurements, and all axes share Q, R and initial
+    covariance, so the gain is computed once per sample and applied to
+    all three lanes.  The lanes are plain floats: for three elements,
+    NumPy call overhead would outweigh the arithmetic.
     """
 
     def __init__(self, q_omega=None, q_bias=None, r=None):
-        self.kf_x = GyroKalmanFilter(q_omega, q_bias, r)
-        self.kf_y = GyroKalmanFilter(q_omega, q_bias, r)
-        self.kf_z = GyroKalmanFilter(q_omega, q_bias, r)
+        self.q_omega = q_omega if q_omega is not None else config.KALMAN_Q_OMEGA
+        self.q_bias = q_bias if q_bias is not None else config.KALMAN_Q_BIAS
+        self.r = r if r is not None else config.KALMAN_R
+
+        # Per-axis bias estimate
+        self.bias_x = 0.0
+        self.bias_y = 0.0
+        self.bias_z = 0.0
+        self.p_bias = 1000.0      # Bias variance P[1, 1], shared by all axes
 
     def set_initial_bias(self, bx: float, by: float, bz: float):
         """Initialize all axes from startup calibration."""
-        self.kf_x.set_initial_bias(bx)
-        self.kf_y.set_initial_bias(by)
-        self.kf_z.set_initial_bias(bz)
+        self.bias_x = float(bx)
+        self.bias_y = float(by)
+        self.bias_z = float(bz)
+        # Reduce bias uncertainty since we have a calibration estimate
+        self.p_bias = 100.0
 
     def update(self, gx: float, gy: float, gz: float):
         """
@@ -229,14 +294,60 @@ class GyroKalmanFilter3Axis:
         Returns:
             (corrected_gx, corrected_gy, corrected_gz) as integers
         """
-        ox = self.kf_x.update(gx)
-        oy = self.kf_y.update(gy)
-        oz = self.kf_z.update(gz)
-        return int(round(ox)), int(round(oy)), int(round(oz))
+        # Predict: P- = diag(Q_omega, p_bias + Q_bias)
+        p_pred = self.p_bias + self.q_bias
+        s = self.q_omega + p_pred + self.r
+
+        # Update all three axes with the shared gain K = [Q_omega, p_pred] / S
+        k_omega = self.q_omega / s
+        k_bias = p_pred / s
+        yx = gx - self.bias_x
+        yy = gy - self.bias_y
+        yz = gz - self.bias_z
+        self.bias_x += k_bias * yx
+        self.bias_y += k_bias * yy
+        self.bias_z += k_bias * yz
+        self.p_bias = p_pred * (self.q_omega + self.r) / s
+
+        # round() is round-half-even, like np.rint
+        return round(k_omega * yx), round(k_omega * yy), round(k_omega * yz)
+
+    def update_array(self, gx, gy, gz):
+        """
+        Run update() over whole gyro columns.
+
+        Returns three lists of ints, identical to calling update() sample
+        by sample, and leaves the filter in the same state.  The gain
+        sequence does not depend on the measurements, so it is computed
+        once; each axis then runs as its own loop over local variables,
+        without a method call per sample.
+        """
+        q_omega, q_bias, r = self.q_omega, self.q_bias, self.r
+        p_bias = self.p_bias
+        gains = []
+        for _ in range(len(gx)):
+            p_pred = p_bias + q_bias
+            s = q_omega + p_pred + r
+            gains.append((q_omega / s, p_pred / s))
+            p_bias = p_pred * (q_omega + r) / s
+        self.p_bias = p_bias
+
+        corrected = []
+        for name, samples in (("bias_x", gx), ("bias_y", gy), ("bias_z", gz)):
+            bias = getattr(self, name)
+            out = []
+            append = out.append
+            for (k_omega, k_bias), z in zip(gains, samples):
+                y = z - bias
+                bias += k_bias * y
+                append(round(k_omega * y))
+            setattr(self, name, bias)
+            corrected.append(out)
+        return tuple(corrected)
 
     def get_bias(self):
         """Return current bias estimates for all axes."""
-        return self.kf_x.get_bias(), self.kf_y.get_bias(), self.kf_z.get_bias()
+        return self.bias_x, self.bias_y, self.bias_z
 
 
 class SlidingWindow:
@@ -244,18 +355,22 @@ class SlidingWindow:
     Sliding window buffer for feature extraction.
 
     Maintains a fixed-size window of recent samples,
-    used for EOG pattern classification.
+    used for EOG pattern classification.  Samples go into a ring buffer
+    (push is O(1), no shifting); get() unrolls it into time order.
     """
 
     def __init__(self, size=None):
         self.size = size or config.ML_WINDOW_SIZE
         self.buffer = np.zeros(self.size)
+        self._head = 0  # slot of the oldest sample / next write
         self.count = 0
 
     def push(self, value: float):
-        """Add a sample, shifting the window."""
-        self.buffer = np.roll(self.buffer, -1)
-        self.buffer[-1] = value
+        """Add a sample, overwriting the oldest."""
+        head = self._head
+        self.buffer[head] = value
+        head += 1
+        self._head = 0 if head == self.size else head
         self.count += 1
 
     def is_full(self) -> bool:
@@ -263,10 +378,79 @@ class SlidingWindow:
         return self.count >= self.size
 
     def get(self) -> np.ndarray:
-        """Return current window contents."""
-        return self.buffer.copy()
+        """Return current window contents, oldest first (a new array)."""
+        head = self._head
+        return np.concatenate((self.buffer[head:], self.buffer[:head]))
 
     def reset(self):
         """Clear the window."""
-        self.buffer = np.zeros(self.size)
+        self.buffer[:] = 0.0
+        self._head = 0
+        self.count = 0
+
+
+class SensorRing:
+    """
+    Multi-channel ring buffer whose latest window is always contiguous.
+
+    Channels are rows of one array (struct-of-arrays), so each channel's
+    window is a contiguous run of memory.  Every sample is written twice,
+    at head and head + size, which keeps the most recent `size` samples
+    in a single slice: window() is a view, with no per-push shift and no
+    wrap-around copy.
+    """
+
+    def __init__(self, channels: int, size=None, dtype=np.float64):
+        self.channels = channels
+        self.size = size or config.ML_WINDOW_SIZE
+        self.buffer = np.zeros((channels, 2 * self.size), dtype=dtype)
+        self.head = 0
+        self.count = 0
+
+    def push(self, *values):
+        """Add one sample per channel."""
+        head = self.head
+        self.buffer[:, head] = values
+        self.buffer[:, head + self.size] = values
+        self.head = head + 1 if head + 1 < self.size else 0
+        self.count += 1
+
+    def extend(self, *columns):
+        """
+        Add a block of samples: one equal-length sequence per channel.
+
+        Same result as push() per sample, with at most four slice writes.
+        """
+        block = np.asarray(columns, dtype=self.buffer.dtype)
+        n = block.shape[1]
+        size = self.size
+        # Only the newest `size` samples survive; older ones would be overwritten
+        m = min(n, size)
+        block = block[:, n - m:]
+        start = (self.head + n - m) % size
+        first = min(m, size - start)
+        self.buffer[:, start:start + first] = block[:, :first]
+        self.buffer[:, start + size:start + size + first] = block[:, :first]
+        rest = m - first
+        self.buffer[:, :rest] = block[:, first:]
+        self.buffer[:, size:size + rest] = block[:, first:]
+        self.head = (self.head + n) % size
+        self.count += n
+
+    def is_full(self) -> bool:
+        """Check if the ring has been fully populated at least once."""
+        return self.count >= self.size
+
+    def window(self) -> np.ndarray:
+        """
+        Return the last `size` samples as a (channels, size) view, oldest first.
+
+        The view is overwritten by later pushes; copy it to keep it.
+        """
+        return self.buffer[:, self.head:self.head + self.size]
+
+    def reset(self):
+        """Clear the ring."""
+        self.buffer[:] = 0
+        self.head = 0
         self.count = 0
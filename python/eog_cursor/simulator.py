@@ -33,10 +33,24 @@ from .serial_reader import SensorPacket
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Letter keys -> SimState flag they hold ('q' quits, handled separately)
+_CHAR_FLAGS = {
+    'u': 'look_up',
+    'd': 'look_down',
+    'l': 'look_left',
+    'r': 'look_right',
+    'n': 'head_nod',
+}
+
+# Standard-normal draws per packet: eog_v, eog_v event, eog_h, eog_h event,
+# gyro_x, gyro_y, gyro_z
+_NOISE_COLUMNS = 7
+_NOISE_BLOCK = 512  # packets' worth of noise drawn per refill
+
+
+@dataclass(slots=True)
 class SimState:
-    """Mutable state for the simulator."""
+    """Mutable state for the simulator (slotted: read on every generated sample)."""
     gyro_x: float = 0.0
     gyro_y: float = 0.0
     gyro_z: float = 0.0
@@ -59,78 +73,74 @@ class HardwareSimulator:
 
     def __init__(self):
         self.state = SimState()
-        self._start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         self._listener = None
         self._gyro_magnitude = 2000  # Simulated gyro amplitude
+        # pynput keys, bound in start(): arrow key -> (gyro axis, sign)
+        self._arrow_keys = {}
+        self._space_key = None
+        self._esc_key = None
+        self._eog_baseline = config.EOG_BASELINE
+        self._noise_std = config.SIM_NOISE_STD
+        self._gyro_noise_std = config.SIM_GYRO_NOISE_STD
+        # Noise is drawn a block at a time (one NumPy call per
+        # _NOISE_BLOCK packets) and handed out row by row as Python floats
+        self._rng = np.random.default_rng()
+        self._noise = []
+        self._noise_idx = 0
 
     def _on_key_press(self, key):
         """Handle key press events."""
-        try:
-            from pynput.keyboard import Key
-            if key == Key.left:
-                self.state.gyro_y = -self._gyro_magnitude
-            elif key == Key.right:
-                self.state.gyro_y = self._gyro_magnitude
-            elif key == Key.up:
-                self.state.gyro_x = -self._gyro_magnitude
-            elif key == Key.down:
-                self.state.gyro_x = self._gyro_magnitude
-            elif key == Key.space:
-                self.state.blink = True
-            elif key == Key.esc:
-                self.state.running = False
-        except AttributeError:
-            pass
-
-        if hasattr(key, 'char') and key.char:
-            if key.char == 'u':
-                self.state.look_up = True
-            elif key.char == 'd':
-                self.state.look_down = True
-            elif key.char == 'l':
-                self.state.look_left = True
-            elif key.char == 'r':
-                self.state.look_right = True
-            elif key.char == 'n':
-                self.state.head_nod = True
-            elif key.char == 'q':
-                self.state.running = False
+        state = self.state
+        arrow = self._arrow_keys.get(key)
+        if arrow is not None:
+            axis, sign = arrow
+            setattr(state, axis, sign * self._gyro_magnitude)
+        elif key == self._space_key:
+            state.blink = True
+        elif key == self._esc_key:
+            state.running = False
+        else:
+            char = getattr(key, 'char', None)
+            if char == 'q':
+                state.running = False
+            else:
+                flag = _CHAR_FLAGS.get(char)
+                if flag is not None:
+                    setattr(state, flag, True)
 
     def _on_key_release(self, key):
         """Handle key release events."""
-        try:
-            from pynput.keyboard import Key
-            if key in (Key.left, Key.right):
-                self.state.gyro_y = 0.0
-            elif key in (Key.up, Key.down):
-                self.state.gyro_x = 0.0
-            elif key == Key.space:
-                self.state.blink = False
-        except AttributeError:
-            pass
-
-        if hasattr(key, 'char') and key.char:
-            if key.char == 'u':
-                self.state.look_up = False
-            elif key.char == 'd':
-                self.state.look_down = False
-            elif key.char == 'l':
-                self.state.look_left = False
-            elif key.char == 'r':
-                self.state.look_right = False
-            elif key.char == 'n':
-                self.state.head_nod = False
+        state = self.state
+        arrow = self._arrow_keys.get(key)
+        if arrow is not None:
+            setattr(state, arrow[0], 0.0)
+        elif key == self._space_key:
+            state.blink = False
+        else:
+            flag = _CHAR_FLAGS.get(getattr(key, 'char', None))
+            if flag is not None:
+                setattr(state, flag, False)
 
     def start(self):
         """Start keyboard listener in background thread."""
-        from pynput.keyboard import Listener
+        from pynput.keyboard import Key, Listener
+
+        self._arrow_keys = {
+            Key.left: ('gyro_y', -1),
+            Key.right: ('gyro_y', 1),
+            Key.up: ('gyro_x', -1),
+            Key.down: ('gyro_x', 1),
+        }
+        self._space_key = Key.space
+        self._esc_key = Key.esc
         self._listener = Listener(
             on_press=self._on_key_press,
             on_release=self._on_key_release
         )
         self._listener.daemon = True
         self._listener.start()
-        self._start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         logger.info("Hardware simulator started.")
         logger.info("Arrows=move, Space(x2)=left-click, Space(hold)=right-click")
         logger.info("Space(x3)=double-click, L/R+N(x2)=center-cursor, U+Up=scroll-up, D+Down=scroll-down")
@@ -158,66 +168,84 @@ class HardwareSimulator:
           Look Left:  ~1000 (negative shift below baseline)
           Idle:       ~2048 (baseline with noise)
         """
-        now = time.time()
-        elapsed_ms = int((now - self._start_time) * 1000)
+        # One clock read: integer ns give an exact millisecond timestamp,
+        # and pc_time stays on the monotonic clock the detectors use
+        now_ns = time.monotonic_ns()
+        elapsed_ms = (now_ns - self._start_ns) // 1_000_000
+        now = now_ns / 1e9
+
+        if self._noise_idx >= len(self._noise):
+            self._noise = self._rng.standard_normal((_NOISE_BLOCK, _NOISE_COLUMNS)).tolist()
+            self._noise_idx = 0
+        n_v, n_v_event, n_h, n_h_event, n_gx, n_gy, n_gz = self._noise[self._noise_idx]
+        self._noise_idx += 1
+        state = self.state
 
         # --- Simulate EOG vertical channel (12-bit, baseline 2048) ---
-        eog_baseline = config.EOG_BASELINE
-        eog_v_noise = np.random.normal(0, config.SIM_NOISE_STD)
-        eog_v = eog_baseline + eog_v_noise
+        eog_baseline = self._eog_baseline
+        noise_std = self._noise_std
+        gyro_noise_std = self._gyro_noise_std
+        eog_v = eog_baseline + n_v * noise_std
 
-        if self.state.blink:
+        if state.blink:
             # Blink: large positive spike (~3500)
-            eog_v += 1500 + np.random.normal(0, 200)
-        elif self.state.look_up:
+            eog_v += 1500 + n_v_event * 200
+        elif state.look_up:
             # Look up: moderate positive shift (~2900)
-            eog_v += 850 + np.random.normal(0, 50)
-        elif self.state.look_down:
+            eog_v += 850 + n_v_event * 50
+        elif state.look_down:
             # Look down: below baseline (~1000)
-            eog_v -= 1050 + np.random.normal(0, 50)
+            eog_v -= 1050 + n_v_event * 50
 
-        eog_v = int(np.clip(eog_v, 0, 4095))
+        # Clamp to the 12-bit ADC range
+        eog_v = 0 if eog_v < 0 else (4095 if eog_v > 4095 else int(eog_v))
 
         # --- Simulate EOG horizontal channel (12-bit, baseline 2048) ---
-        eog_h_noise = np.random.normal(0, config.SIM_NOISE_STD)
-        eog_h = eog_baseline + eog_h_noise
+        eog_h = eog_baseline + n_h * noise_std
 
-        if self.state.look_right:
+        if state.look_right:
             # Look right: positive shift (~2900)
-            eog_h += 850 + np.random.normal(0, 50)
-        elif self.state.look_left:
+            eog_h += 850 + n_h_event * 50
+        elif state.look_left:
             # Look left: below baseline (~1000)
-            eog_h -= 1050 + np.random.normal(0, 50)
+            eog_h -= 1050 + n_h_event * 50
 
-        eog_h = int(np.clip(eog_h, 0, 4095))
+        eog_h = 0 if eog_h < 0 else (4095 if eog_h > 4095 else int(eog_h))
 
         # --- Simulate IMU gyro ---
         # Head nod → gx spike (overrides arrow key gx)
-        if self.state.head_nod:
-            gx = int(4000 + np.random.normal(0, 200))
+        if state.head_nod:
+            gx = int(4000 + n_gx * 200)
         else:
-            gx = int(self.state.gyro_x + np.random.normal(0, config.SIM_GYRO_NOISE_STD))
-        gy = int(self.state.gyro_y + np.random.normal(0, config.SIM_GYRO_NOISE_STD))
-
-        gz = int(np.random.normal(0, config.SIM_GYRO_NOISE_STD))
-
-        return SensorPacket(
-            timestamp=elapsed_ms,
-            eog_v=eog_v,
-            eog_h=eog_h,
-            gyro_x=gx,
-            gyro_y=gy,
-            gyro_z=gz,
-            pc_time=now
-        )
+            gx = int(state.gyro_x + n_gx * gyro_noise_std)
+        gy = int(state.gyro_y + n_gy * gyro_noise_std)
+
+        gz = int(n_gz * gyro_noise_std)
+
+        # Positional construction: (timestamp, eog_v, eog_h, gx, gy, gz, pc_time)
+        return SensorPacket(elapsed_ms, eog_v, eog_h, gx, gy, gz, now)
 
     def stream(self):
-        """Generator that yields simulated packets at the configured sample rate."""
+        """
+        Generator that yields simulated packets at the configured sample rate.
+
+        Pacing uses perf_counter() deadlines, so the time spent generating
+        and consuming each packet does not stretch the period.  After a
+        stall the schedule restarts from now instead of bursting to catch
+        up, as a live sensor would.
+        """
         self.start()
+        period = config.SAMPLE_PERIOD
         try:
+            deadline = time.perf_counter()
             while self.state.running:
                 yield self.generate_packet()
-                time.sleep(config.SAMPLE_PERIOD)
+                deadline += period
+                sleep_time = deadline - time.perf_counter()
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+                else:
+                    deadline = time.perf_counter()
         finally:
             self.stop()
 
@@ -29,10 +29,14 @@ Usage:
 import argparse
 import logging
 import sys
-import time
+
+import numpy as np
 
 from eog_cursor import config
-from eog_cursor.cursor_control import ThresholdController, StateSpaceController
+from eog_cursor.cursor_control import (
+    ThresholdController, StateSpaceController, gaze_flags, _get_pyautogui, _send_hotkey,
+)
+from eog_cursor.event_detector import EOGEvent, detect_blinks
 from eog_cursor.signal_processing import EOGLowPassFilter, GyroCalibrator, GyroKalmanFilter3Axis
 
 
@@ -58,6 +62,14 @@ def _create_keyboard_overlay(enabled: bool):
 
 def run_control_loop(source, controller, calibrator=None, kalman=None):
     """Run the sensor → filter → controller loop (shared by threshold and statespace modes)."""
+    if hasattr(source, "stream_batch") and not source.realtime:
+        time_offset = 0.0
+        while True:
+            time_offset = run_offline(source, controller, calibrator, kalman,
+                                      time_offset)
+            if not source.loop:
+                return
+
     if config.EOG_LOWPASS_ENABLED:
         filter_v = EOGLowPassFilter()
         filter_h = EOGLowPassFilter()
@@ -66,17 +78,70 @@ def run_control_loop(source, controller, calibrator=None, kalman=None):
         filter_h = None
 
     for packet in source.stream():
-        eog_v = float(packet.eog_v)
-        eog_h = float(packet.eog_h)
+        # One tuple unpack instead of per-field attribute reads; the int
+        # samples need no float() first (int * float arithmetic is exact
+        # for 12-bit ADC values)
+        _, eog_v, eog_h, gx, gy, gz, now = packet
         if filter_v:
             eog_v = filter_v.filter_sample(eog_v)
             eog_h = filter_h.filter_sample(eog_h)
-        gx, gy, gz = packet.gyro_x, packet.gyro_y, packet.gyro_z
         if kalman:
             gx, gy, gz = kalman.update(gx, gy, gz)
         elif calibrator:
             gx, gy, gz = calibrator.correct(gx, gy, gz)
-        controller.update(eog_v, eog_h, gx, gy, gz)
+        controller.update(eog_v, eog_h, gx, gy, gz, now=now)
+
+
+def run_offline(source, controller, calibrator=None, kalman=None,
+                time_offset: float = 0.0) -> float:
+    """
+    Run one pass of a fast CSV replay through the filter → controller chain.
+
+    Reads the recording as column arrays (no SensorPacket per sample) and
+    clocks the detectors with the recording's own timestamps, so blink,
+    gaze, and nod durations are judged in signal time rather than in how
+    fast the replay happens to run.
+
+    The timestamps are shifted by `time_offset` seconds.  Returns the
+    offset for the next pass of a looped replay, which continues one
+    sample period after this pass ends, so the controller's deadlines and
+    cooldowns see a clock that keeps increasing.
+    """
+    batch = source.stream_batch()
+    times = (batch["timestamp"] / 1000.0 + time_offset).tolist()
+    eog_v = batch["eog_v"].tolist()
+    eog_h = batch["eog_h"].tolist()
+    gyro = (batch["gyro_x"], batch["gyro_y"], batch["gyro_z"])
+    if calibrator and not kalman:
+        # Static bias correction is independent per sample: do it column-wise
+        gyro = calibrator.correct_array(*gyro)
+    gyro_x, gyro_y, gyro_z = (g.tolist() for g in gyro)
+    if kalman:
+        # The gyro chain does not depend on the controller: filter whole columns
+        gyro_x, gyro_y, gyro_z = kalman.update_array(gyro_x, gyro_y, gyro_z)
+
+    if config.EOG_LOWPASS_ENABLED:
+        filter_v = EOGLowPassFilter()
+        filter_h = EOGLowPassFilter()
+        eog_v = filter_v.filter_array(batch["eog_v"]).tolist()
+        eog_h = filter_h.filter_array(batch["eog_h"]).tolist()
+
+    # Threshold gate for every sample in one vectorized pass
+    gaze_v, gaze_h = gaze_flags(np.asarray(eog_v), np.asarray(eog_h))
+    gaze = list(zip(gaze_v.tolist(), gaze_h.tolist()))
+
+    # Blink patterns from threshold crossings instead of a per-sample state machine
+    blinks = [EOGEvent.NONE] * len(times)
+    for event in detect_blinks(eog_v, times):
+        blinks[event['index']] = EOGEvent(event['event'])
+
+    for i in range(len(times)):
+        controller.update(eog_v[i], eog_h[i], gyro_x[i], gyro_y[i], gyro_z[i],
+                          now=times[i], gaze=gaze[i], blink=blinks[i])
+
+    if not times:
+        return time_offset
+    return times[-1] + config.SAMPLE_PERIOD - int(batch["timestamp"][0]) / 1000.0
 
 
 def run_threshold_mode(source, calibrator=None, kalman=None, keyboard_overlay=None):
@@ -87,7 +152,8 @@ def run_threshold_mode(source, calibrator=None, kalman=None, keyboard_overlay=No
     print(f"  Triple blink:     3 blinks within {config.TRIPLE_BLINK_WINDOW}s → double click")
     print(f"  Long blink:       hold >={config.LONG_BLINK_MIN_DURATION}s → right click")
     print(f"  Scroll:           eye gaze + head tilt fusion")
-    run_control_loop(source, ThresholdController(keyboard_overlay), calibrator, kalman)
+    controller = ThresholdController(keyboard_overlay, action_thread=True)
+    run_control_loop(source, controller, calibrator, kalman)
 
 
 def run_statespace_mode(source, calibrator=None, kalman=None, keyboard_overlay=None):
@@ -96,7 +162,8 @@ def run_statespace_mode(source, calibrator=None, kalman=None, keyboard_overlay=N
     print(f"  Velocity retain: {config.SS_VELOCITY_RETAIN}")
     print(f"  Sensitivity:  {config.SS_SENSITIVITY}")
     print(f"  Deadzone:     {config.GYRO_DEADZONE}")
-    run_control_loop(source, StateSpaceController(keyboard_overlay), calibrator, kalman)
+    controller = StateSpaceController(keyboard_overlay, action_thread=True)
+    run_control_loop(source, controller, calibrator, kalman)
 
 
 def run_ml_mode(source, calibrator=None, kalman=None, keyboard_overlay=None):
@@ -104,7 +171,10 @@ def run_ml_mode(source, calibrator=None, kalman=None, keyboard_overlay=None):
     from eog_cursor.ml_classifier import EOGClassifier
     from eog_cursor.event_detector import EOGEvent
 
-    classifier = EOGClassifier()
+    # Live sources classify on a worker thread so a prediction never holds
+    # up packet reads; fast CSV replay classifies the recording up front
+    offline = hasattr(source, "stream_batch") and not source.realtime
+    classifier = EOGClassifier(background=not offline)
     if not classifier.load():
         print("ERROR: No trained model found.")
         print("Run training first: python -m scripts.train_model --generate-demo")
@@ -121,9 +191,9 @@ def run_ml_mode(source, calibrator=None, kalman=None, keyboard_overlay=None):
     print(f"  Window size: {config.ML_WINDOW_SIZE}")
     print(f"  Sensor fusion: scroll and back/fwd require eye + head agreement")
 
-    import pyautogui
-    pyautogui.FAILSAFE = False
-    pyautogui.PAUSE = 0
+    # Same GUI setup as the controllers: pyautogui configured once, and
+    # back/forward chords sent through XTest where available
+    gui = _get_pyautogui()
 
     # Per-action cooldowns (consistent with threshold/statespace modes)
     last_blink_time = 0.0
@@ -154,18 +224,27 @@ def run_ml_mode(source, calibrator=None, kalman=None, keyboard_overlay=None):
         EOGEvent.LOOK_RIGHT: "look_right",
     }
 
-    for packet in source.stream():
+    # Fast CSV replay: the whole recording is known up front, so classify
+    # every window in one batched SVM call.  Each replay pass is classified
+    # from a fresh window, like run_offline() starts each pass fresh.
+    recorded = None
+    if offline:
+        batch = source.stream_batch()
+        recorded = classifier.predict_recording(batch["eog_v"], batch["eog_h"])
+
+    for i, packet in enumerate(source.stream()):
+        _, eog_v, eog_h, gx, gy, gz, now = packet
         # ML classification uses raw EOG values (must match training data)
-        prediction = classifier.predict(float(packet.eog_v), float(packet.eog_h))
+        if recorded is not None:
+            prediction = recorded[i % len(recorded)]
+        else:
+            prediction = classifier.predict(eog_v, eog_h)
 
         # predict() returns None for 19 out of 20 samples (ML_WINDOW_STEP).
         # Remember last non-None prediction so cursor suppression is continuous.
         if prediction is not None:
             last_prediction = prediction
 
-        now = time.time()
-        gx, gy = packet.gyro_x, packet.gyro_y
-        gz = packet.gyro_z
         if kalman:
             gx, gy, gz = kalman.update(gx, gy, gz)
         elif calibrator:
@@ -190,21 +269,21 @@ def run_ml_mode(source, calibrator=None, kalman=None, keyboard_overlay=None):
 
             if prediction == "double_blink":
                 if now - last_blink_time > config.DOUBLE_BLINK_COOLDOWN and now - last_action_time > 0.5:
-                    pyautogui.click(_pause=False)
+                    gui.click(_pause=False)
                     action = "left click"
                     last_blink_time = now
                     last_action_time = now
                     cursor_unfreeze_time = now + 0.2
             elif prediction == "triple_blink":
                 if now - last_blink_time > config.TRIPLE_BLINK_COOLDOWN and now - last_action_time > 0.5:
-                    pyautogui.doubleClick(_pause=False)
+                    gui.doubleClick(_pause=False)
                     action = "double click"
                     last_blink_time = now
                     last_action_time = now
                     cursor_unfreeze_time = now + 0.2
             elif prediction == "long_blink":
                 if now - last_blink_time > config.LONG_BLINK_COOLDOWN and now - last_action_time > 0.5:
-                    pyautogui.click(button='right', _pause=False)
+                    gui.click(button='right', _pause=False)
                     action = "right click"
                     last_blink_time = now
                     last_action_time = now
@@ -226,7 +305,7 @@ def run_ml_mode(source, calibrator=None, kalman=None, keyboard_overlay=None):
                 if ml_scroll_state == "SCROLL_UP_READY" and gx < -deadzone:
                     if now - last_scroll_time > config.SCROLL_COOLDOWN and now - last_action_time > 0.5:
                         amount = max(1, int(abs(gx) / deadzone * config.SCROLL_AMOUNT))
-                        pyautogui.scroll(amount, _pause=False)
+                        gui.scroll(amount, _pause=False)
                         action = f"scroll up {amount} lines (scroll ready + head up)"
                         last_scroll_time = now
                         last_action_time = now
@@ -234,7 +313,7 @@ def run_ml_mode(source, calibrator=None, kalman=None, keyboard_overlay=None):
                 elif ml_scroll_state == "SCROLL_DOWN_READY" and gx > deadzone:
                     if now - last_scroll_time > config.SCROLL_COOLDOWN and now - last_action_time > 0.5:
                         amount = max(1, int(abs(gx) / deadzone * config.SCROLL_AMOUNT))
-                        pyautogui.scroll(-amount, _pause=False)
+                        gui.scroll(-amount, _pause=False)
                         action = f"scroll down {amount} lines (scroll ready + head down)"
                         last_scroll_time = now
                         last_action_time = now
@@ -251,20 +330,20 @@ def run_ml_mode(source, calibrator=None, kalman=None, keyboard_overlay=None):
 
                 if ml_nav_state == "NAV_LEFT_READY" and gy < -deadzone:
                     if now - last_nav_time > config.HORIZONTAL_GAZE_COOLDOWN and now - last_action_time > 0.5:
-                        pyautogui.hotkey('alt', 'left', _pause=False)
+                        _send_hotkey(gui, 'alt', 'left')
                         action = "browser back (nav ready + head left)"
                         last_nav_time = now
                         last_action_time = now
                         cursor_unfreeze_time = now + 0.2
                 elif ml_nav_state == "NAV_RIGHT_READY" and gy > deadzone:
                     if now - last_nav_time > config.HORIZONTAL_GAZE_COOLDOWN and now - last_action_time > 0.5:
-                        pyautogui.hotkey('alt', 'right', _pause=False)
+                        _send_hotkey(gui, 'alt', 'right')
                         action = "browser forward (nav ready + head right)"
                         last_nav_time = now
                         last_action_time = now
                         cursor_unfreeze_time = now + 0.2
             if action:
-                logging.getLogger(__name__).info(f"ML: {prediction} -> {action}")
+                logging.getLogger(__name__).info("ML: %s -> %s", prediction, action)
 
         # Reset ready states when ML stops predicting the corresponding gaze
         if last_prediction not in ("look_up", "look_down"):
@@ -291,8 +370,8 @@ def run_ml_mode(source, calibrator=None, kalman=None, keyboard_overlay=None):
         elif last_prediction not in ("idle", "blink") and now < cursor_unfreeze_time:
             cursor_gx = 0
             cursor_gy = 0
-            controller.state[1] = 0
-            controller.state[3] = 0
+            controller.vx = 0.0
+            controller.vy = 0.0
 
         else:
             cursor_gx = gx
@@ -301,7 +380,7 @@ def run_ml_mode(source, calibrator=None, kalman=None, keyboard_overlay=None):
         controller.update(
             config.EOG_BASELINE, config.EOG_BASELINE,
             cursor_gx, cursor_gy, gz,
-            cursor_frozen_override=cursor_frozen
+            cursor_frozen_override=cursor_frozen, now=now
         )
 
 
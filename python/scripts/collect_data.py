@@ -24,7 +24,6 @@ Labeling procedure:
 """
 
 import argparse
-import csv
 import os
 import sys
 import time
@@ -61,15 +60,17 @@ def run_collection(source, output_path: str):
     from pynput import keyboard
 
     current_label = 'idle'
+    current_label_bytes = b'idle'  # pre-encoded for the CSV rows
     running = True
     sample_count = 0
     label_counts = {label: 0 for label in config.ML_CLASSES}
 
     def on_press(key):
-        nonlocal current_label, running
+        nonlocal current_label, current_label_bytes, running
         try:
             if hasattr(key, 'char') and key.char in LABEL_KEYS:
                 current_label = LABEL_KEYS[key.char]
+                current_label_bytes = current_label.encode()
             elif key == keyboard.Key.esc:
                 running = False
         except AttributeError:
@@ -92,30 +93,28 @@ def run_collection(source, output_path: str):
     print(f"Output: {output_path}")
     print("Press ESC to stop.\n")
 
-    with open(output_path, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(['timestamp', 'eog_v', 'eog_h', 'gyro_x', 'gyro_y', 'gyro_z', 'label'])
+    # Rows are fixed integer fields plus a label identifier, so they are
+    # formatted directly as bytes into a binary file (same bytes as
+    # csv.writer, CRLF included), skipping the text layer's encoding.  The
+    # file is flushed once per status line rather than per sample; closing
+    # it on exit (ESC or Ctrl+C) writes out the rest.
+    with open(output_path, 'wb', buffering=64 * 1024) as f:
+        f.write(b"timestamp,eog_v,eog_h,gyro_x,gyro_y,gyro_z,label\r\n")
 
         for packet in source.stream():
             if not running:
                 break
 
-            writer.writerow([
-                packet.timestamp,
-                packet.eog_v,
-                packet.eog_h,
-                packet.gyro_x,
-                packet.gyro_y,
-                packet.gyro_z,
-                current_label
-            ])
-            f.flush()
+            timestamp, eog_v, eog_h, gyro_x, gyro_y, gyro_z, _ = packet
+            f.write(b"%d,%d,%d,%d,%d,%d,%s\r\n" % (
+                timestamp, eog_v, eog_h, gyro_x, gyro_y, gyro_z, current_label_bytes))
 
             sample_count += 1
             if current_label in label_counts:
                 label_counts[current_label] += 1
 
             if sample_count % 200 == 0:  # Print status every second
+                f.flush()
                 elapsed = sample_count / config.SAMPLE_RATE
                 status = f"\r[{elapsed:.0f}s] Samples: {sample_count} | "
                 status += f"Label: {current_label:>10} | "
@@ -17,6 +17,7 @@ import sys
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.metrics import classification_report, confusion_matrix
 from sklearn.model_selection import cross_val_score, StratifiedKFold
 
@@ -24,12 +25,19 @@ from sklearn.model_selection import cross_val_score, StratifiedKFold
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from eog_cursor import config
-from eog_cursor.feature_extraction import extract_dual_features, DUAL_FEATURE_NAMES
+from eog_cursor.csv_replay import read_recording_csv
+from eog_cursor.feature_extraction import extract_dual_features_batch, DUAL_FEATURE_NAMES
 from eog_cursor.ml_classifier import train_model
 
 
 def load_data(data_paths: list[str]) -> pd.DataFrame:
-    """Load and concatenate multiple CSV data files."""
+    """
+    Load and concatenate multiple CSV data files.
+
+    Files are parsed with csv_replay.read_recording_csv(): explicit int32
+    sensor columns instead of inferred int64, and the pyarrow engine when
+    it is installed.
+    """
     frames = []
     for path in data_paths:
         if os.path.isdir(path):
@@ -38,9 +46,9 @@ def load_data(data_paths: list[str]) -> pd.DataFrame:
                 # Skip replay file — it's held out for demo/testing
                 if os.path.basename(f) == "demo_replay.csv":
                     continue
-                frames.append(pd.read_csv(f))
+                frames.append(read_recording_csv(f))
         else:
-            frames.append(pd.read_csv(path))
+            frames.append(read_recording_csv(path))
 
     if not frames:
         raise FileNotFoundError("No CSV data files found")
@@ -57,6 +65,8 @@ def extract_windowed_features(data: pd.DataFrame,
     Extract features using sliding windows.
 
     For each window, uses the majority label as the window's label.
+    All windows are featurized in vectorized batches rather than one
+    extract_dual_features() call per window.
     """
     window_size = window_size or config.ML_WINDOW_SIZE
     step_size = step_size or config.ML_WINDOW_STEP
@@ -78,28 +88,30 @@ def extract_windowed_features(data: pd.DataFrame,
 
     labels = data['label'].values
 
-    features_list = []
-    labels_list = []
-
-    for start in range(0, len(eog_v_values) - window_size, step_size):
-        window_v = eog_v_values[start:start + window_size].astype(float)
-        window_h = eog_h_values[start:start + window_size].astype(float)
-        window_labels = labels[start:start + window_size]
-
-        # Use majority label for this window
-        unique, counts = np.unique(window_labels, return_counts=True)
-        majority_label = unique[np.argmax(counts)]
-
-        # Skip windows with mixed labels (transition regions)
-        if np.max(counts) < window_size * 0.7:
-            continue
-
-        feats = extract_dual_features(window_v, window_h)
-        features_list.append(feats)
-        labels_list.append(majority_label)
-
-    X = np.array(features_list)
-    y = np.array(labels_list)
+    # Majority label per window from running per-label counts: with labels
+    # coded in sorted order, argmax picks the same label np.unique would
+    # (ties go to the first in sort order)
+    starts = np.arange(0, len(eog_v_values) - window_size, step_size)
+    label_names, codes = np.unique(labels, return_inverse=True)
+    running = np.zeros((len(labels) + 1, len(label_names)), dtype=np.int32)
+    np.cumsum(np.eye(len(label_names), dtype=np.int32)[codes], axis=0, out=running[1:])
+    counts = running[starts + window_size] - running[starts]
+
+    # Skip windows with mixed labels (transition regions)
+    keep = counts.max(axis=1) >= window_size * 0.7
+    starts = starts[keep]
+    y = label_names[counts[keep].argmax(axis=1)]
+
+    # Features for all kept windows, a block at a time to bound memory
+    if len(starts):
+        windows_v = sliding_window_view(eog_v_values.astype(float), window_size)
+        windows_h = sliding_window_view(eog_h_values.astype(float), window_size)
+        X = np.vstack([
+            extract_dual_features_batch(windows_v[block], windows_h[block])
+            for block in np.array_split(starts, max(1, len(starts) // 4096))
+        ])
+    else:
+        X = np.empty((0, len(DUAL_FEATURE_NAMES)))
     print(f"Extracted {len(X)} feature windows ({len(DUAL_FEATURE_NAMES)} dual-channel features each)")
     return X, y
 
@@ -114,7 +126,7 @@ def generate_demo_data(output_dir: str):
     transitions) matching what the model will see during replay or real-time
     inference.
     """
-    from scripts.generate_demo_data import generate_session
+    from scripts.generate_demo_data import generate_session, write_session_csv
 
     # Generate 3 sessions with 30 events per class for sufficient training data
     frames = []
@@ -125,7 +137,7 @@ def generate_demo_data(output_dir: str):
     combined = pd.concat(frames, ignore_index=True)
     os.makedirs(output_dir, exist_ok=True)
     output_path = os.path.join(output_dir, "demo_training_data.csv")
-    combined.to_csv(output_path, index=False)
+    write_session_csv(combined, output_path)
     print(f"Generated {len(combined)} demo samples -> {output_path}")
     return output_path
 
@@ -0,0 +1,171 @@
+"""
+Tests for CSV replay source.
+
+Verifies column loading, legacy column handling, and the memory-mapped
+.npy replay cache. Can be run without hardware.
+"""
+
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eog_cursor.csv_replay import CSVReplaySource
+from eog_cursor import config
+
+
+class TestCSVReplaySource(unittest.TestCase):
+    """Test CSV loading, streaming, and caching."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmpdir, "session.csv")
+        n = 50
+        pd.DataFrame({
+            'timestamp': np.arange(n) * 5,
+            'eog_v': np.full(n, 2048) + np.arange(n),
+            'eog_h': np.full(n, 2048) - np.arange(n),
+            'gyro_x': np.arange(n) * 10,
+            'gyro_y': -np.arange(n) * 10,
+            'gyro_z': np.zeros(n, dtype=int),
+            'label': ['idle'] * n,
+        }).to_csv(self.csv_path, index=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _stream_all(self, source):
+        return [(p.timestamp, p.eog_v, p.eog_h, p.gyro_x, p.gyro_y, p.gyro_z)
+                for p in source.stream()]
+
+    def test_stream_matches_csv(self):
+        """Streamed packets should reproduce the CSV rows in order."""
+        source = CSVReplaySource(self.csv_path, realtime=False)
+        source.load()
+        rows = self._stream_all(source)
+        self.assertEqual(len(rows), 50)
+        self.assertEqual(rows[3], (15, 2051, 2045, 30, -30, 0))
+        self.assertEqual(source.num_samples, 50)
+        self.assertAlmostEqual(source.duration_seconds, 50 / config.SAMPLE_RATE)
+
+    def test_cache_written_and_reused(self):
+        """Second load should memory-map the cache and stream identical data."""
+        first = CSVReplaySource(self.csv_path, realtime=False)
+        first.load()
+        self.assertTrue(os.path.exists(self.csv_path + ".npy"))
+
+        second = CSVReplaySource(self.csv_path, realtime=False)
+        second.load()
+        self.assertIsNone(second.data)  # CSV was not re-parsed
+        self.assertEqual(self._stream_all(first), self._stream_all(second))
+
+    def test_truncated_cache_rebuilt(self):
+        """A cache cut short by an interrupted run should be re-parsed and rewritten."""
+        expected = self._stream_all(CSVReplaySource(self.csv_path, realtime=False))
+        cache_path = self.csv_path + ".npy"
+        size = os.path.getsize(cache_path)
+        with open(cache_path, "r+b") as f:
+            f.truncate(size // 2)
+
+        source = CSVReplaySource(self.csv_path, realtime=False)
+        source.load()
+        self.assertIsNotNone(source.data)
+        self.assertEqual(self._stream_all(source), expected)
+        self.assertEqual(os.path.getsize(cache_path), size)
+        self.assertEqual([f for f in os.listdir(self.tmpdir) if f.endswith(".tmp")], [])
+
+        cached = CSVReplaySource(self.csv_path, realtime=False)
+        cached.load()
+        self.assertIsNone(cached.data)
+
+    def test_stale_cache_ignored(self):
+        """A cache older than the CSV should be rebuilt."""
+        CSVReplaySource(self.csv_path, realtime=False).load()
+        cache_path = self.csv_path + ".npy"
+        old = os.path.getmtime(self.csv_path) - 10
+        os.utime(cache_path, (old, old))
+
+        source = CSVReplaySource(self.csv_path, realtime=False)
+        source.load()
+        self.assertIsNotNone(source.data)
+
+    def test_stream_batch_columns(self):
+        """stream_batch() should expose the same samples as column arrays."""
+        source = CSVReplaySource(self.csv_path, realtime=False)
+        batch = source.stream_batch()
+        self.assertEqual(set(batch), {'timestamp', 'eog_v', 'eog_h',
+                                      'gyro_x', 'gyro_y', 'gyro_z'})
+        rows = self._stream_all(source)
+        for i in (0, 17, 49):
+            self.assertEqual(rows[i], tuple(int(batch[k][i]) for k in
+                             ('timestamp', 'eog_v', 'eog_h', 'gyro_x', 'gyro_y', 'gyro_z')))
+
+    def test_out_of_int16_range_not_truncated(self):
+        """Values beyond int16 should stream exactly and skip the cache."""
+        wide_path = os.path.join(self.tmpdir, "wide.csv")
+        pd.DataFrame({
+            'timestamp': [0, 5],
+            'eog_v': [2048, 2048],
+            'gyro_x': [40000, -40000],
+            'gyro_y': [0, 0],
+            'gyro_z': [0, 0],
+        }).to_csv(wide_path, index=False)
+
+        source = CSVReplaySource(wide_path, realtime=False)
+        rows = self._stream_all(source)
+        self.assertEqual([r[3] for r in rows], [40000, -40000])
+        self.assertFalse(os.path.exists(wide_path + ".npy"))
+
+    def test_pc_time_follows_recording(self):
+        """pc_time should advance by the recorded timestamp deltas."""
+        source = CSVReplaySource(self.csv_path, realtime=False)
+        packets = list(source.stream())
+        self.assertAlmostEqual(packets[10].pc_time - packets[0].pc_time, 0.050)
+
+    def test_loop_pc_time_non_decreasing(self):
+        """Looped replay should continue pc_time instead of restarting it."""
+        source = CSVReplaySource(self.csv_path, realtime=False, loop=True)
+        times = [p.pc_time for p in itertools.islice(source.stream(), 120)]
+        self.assertTrue(all(b >= a for a, b in zip(times, times[1:])))
+        self.assertAlmostEqual(times[50] - times[49], config.SAMPLE_PERIOD)
+        self.assertAlmostEqual(times[100] - times[0], 100 * config.SAMPLE_PERIOD)
+
+    def test_pyarrow_engine_failure_falls_back(self):
+        """An error from the pyarrow engine should fall back to the C parser."""
+        real_read_csv = pd.read_csv
+
+        def read_csv(path, engine=None, **kwargs):
+            if engine == "pyarrow":
+                raise ValueError("pyarrow engine cannot honour dtype")
+            return real_read_csv(path, **kwargs)
+
+        with mock.patch("eog_cursor.csv_replay.pd.read_csv", side_effect=read_csv):
+            source = CSVReplaySource(self.csv_path, realtime=False)
+            rows = self._stream_all(source)
+        self.assertEqual(rows[3], (15, 2051, 2045, 30, -30, 0))
+
+    def test_legacy_single_channel(self):
+        """Legacy 'eog' column maps to eog_v; eog_h defaults to baseline."""
+        legacy_path = os.path.join(self.tmpdir, "legacy.csv")
+        pd.DataFrame({
+            'eog': [2100, 2200],
+            'gyro_x': [0, 0],
+            'gyro_y': [0, 0],
+            'gyro_z': [0, 0],
+        }).to_csv(legacy_path, index=False)
+
+        source = CSVReplaySource(legacy_path, realtime=False)
+        rows = self._stream_all(source)
+        self.assertEqual(rows[1], (5, 2200, config.EOG_BASELINE, 0, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,11 +8,13 @@ import sys
 import os
 import unittest
 
+import numpy as np
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from eog_cursor.event_detector import (
     BlinkDetector, GazeDetector, HorizontalGazeDetector,
-    DoubleNodDetector, BlinkState, EOGEvent,
+    DoubleNodDetector, BlinkState, EOGEvent, detect_blinks,
 )
 from eog_cursor import config
 
@@ -418,5 +420,51 @@ class TestHorizontalGazeDetector(unittest.TestCase):
         self.assertEqual(result, EOGEvent.NONE)
 
 
+class TestDetectBlinks(unittest.TestCase):
+    """Test the whole-recording blink pass against the per-sample state machine."""
+
+    def _reference(self, eog, t):
+        det = BlinkDetector()
+        events = []
+        for i, (e, now) in enumerate(zip(eog.tolist(), t.tolist())):
+            r = det.update(e, now)
+            if r != EOGEvent.NONE:
+                events.append((i, r))
+        return events
+
+    def _detect(self, eog, t):
+        return [(int(e['index']), EOGEvent(e['event'])) for e in detect_blinks(eog, t)]
+
+    def test_double_blink(self):
+        """Two short blinks should give one DOUBLE_BLINK after the triple window."""
+        eog = np.full(400, 2048)
+        eog[10:30] = 3500
+        eog[70:90] = 3500
+        t = np.arange(eog.size) * config.SAMPLE_PERIOD
+        events = self._detect(eog, t)
+        self.assertEqual([e for _, e in events], [EOGEvent.DOUBLE_BLINK])
+        self.assertEqual(events, self._reference(eog, t))
+
+    def test_matches_state_machine_on_random_pulses(self):
+        """Random pulse trains should produce identical events and sample indices."""
+        rng = np.random.default_rng(1)
+        for _ in range(100):
+            n = int(rng.integers(50, 3000))
+            high = np.zeros(n, dtype=bool)
+            i = 0
+            while i < n:
+                i += int(rng.integers(1, 200))
+                length = int(rng.integers(1, 120))
+                high[i:i + length] = True
+                i += length
+            eog = np.where(high, 3000, 2048)
+            t = 5.0 + np.arange(n) * config.SAMPLE_PERIOD
+            self.assertEqual(self._detect(eog, t), self._reference(eog, t))
+
+    def test_empty_input(self):
+        """No samples should give an empty event log."""
+        self.assertEqual(detect_blinks(np.array([]), np.array([])).size, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ and prediction using synthetic data.
 import os
 import sys
 import tempfile
+import time
 import unittest
 
 import numpy as np
@@ -15,10 +16,12 @@ import numpy as np
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from eog_cursor.feature_extraction import (
-    extract_features, extract_dual_features,
+    extract_features, extract_dual_features, extract_dual_features_batch,
     FEATURE_NAMES, DUAL_FEATURE_NAMES,
 )
-from eog_cursor.ml_classifier import EOGClassifier, train_model
+from eog_cursor.ml_classifier import (
+    EOGClassifier, train_model, _svc_predict_row, _unpack_svc,
+)
 from eog_cursor import config
 
 
@@ -195,6 +198,105 @@ class TestMLPipeline(unittest.TestCase):
         # Blink should have higher peak amplitude (feature 0)
         self.assertGreater(blink_feats[0], idle_feats[0] * 2)
 
+    def test_unpacked_svc_matches_sklearn(self):
+        """The direct RBF vote should reproduce SVC.predict() row by row."""
+        rng = np.random.default_rng(5)
+        rows = np.vstack([self.scaler.transform(self.X),
+                          rng.normal(0, 2, (300, self.X.shape[1]))])
+        binary = np.isin(self.y, ["idle", "blink"])
+        binary_model, _ = train_model(self.X[binary], self.y[binary],
+                                      save_dir=tempfile.mkdtemp(dir=self.tmpdir))
+
+        for model in (self.model, binary_model):
+            unpacked = _unpack_svc(model)
+            got = [_svc_predict_row(row, *unpacked) for row in rows]
+            self.assertEqual(got, model.predict(rows).tolist())
+
+    def test_unsupported_svc_falls_back(self):
+        """break_ties and non-ovr models should not take the direct vote."""
+        from sklearn.svm import SVC
+
+        self.assertIsNotNone(_unpack_svc(self.model))
+        for params in ({"break_ties": True}, {"decision_function_shape": "ovo"}):
+            model = SVC(kernel="rbf", C=100, **params)
+            model.fit(self.scaler.transform(self.X), self.y)
+            self.assertIsNone(_unpack_svc(model))
+
+    def test_predict_recording_matches_stream(self):
+        """Batched whole-recording labels should match streamed predict()."""
+        model_path = os.path.join(self.tmpdir, "eog_model.pkl")
+        scaler_path = os.path.join(self.tmpdir, "eog_scaler.pkl")
+        rng = np.random.default_rng(11)
+        n = config.ML_WINDOW_SIZE + 7 * config.ML_WINDOW_STEP + 5
+        eog_v = rng.normal(1500, 40, n)
+        eog_v[250:270] = 3500.0
+        eog_h = rng.normal(config.EOG_BASELINE, 40, n)
+
+        streaming = EOGClassifier(model_path=model_path, scaler_path=scaler_path)
+        streaming.load()
+        expected = [streaming.predict(v, h) for v, h in zip(eog_v, eog_h)]
+
+        batched = EOGClassifier(model_path=model_path, scaler_path=scaler_path)
+        batched.load()
+        self.assertEqual(batched.predict_recording(eog_v, eog_h), expected)
+        self.assertEqual(sum(r is not None for r in expected), 8)
+
+    def test_background_predictions_match(self):
+        """Background mode should deliver the same labels on later calls."""
+        model_path = os.path.join(self.tmpdir, "eog_model.pkl")
+        scaler_path = os.path.join(self.tmpdir, "eog_scaler.pkl")
+        rng = np.random.default_rng(12)
+        n = config.ML_WINDOW_SIZE + 5 * config.ML_WINDOW_STEP
+        eog_v = rng.normal(1500, 40, n)
+        eog_v[230:250] = 3500.0
+        eog_h = rng.normal(config.EOG_BASELINE, 40, n)
+
+        sync = EOGClassifier(model_path=model_path, scaler_path=scaler_path)
+        sync.load()
+        background = EOGClassifier(model_path=model_path, scaler_path=scaler_path,
+                                   background=True)
+        background.load()
+
+        expected, got = [], []
+        for v, h in zip(eog_v, eog_h):
+            label = sync.predict(v, h)
+            got.append(background.predict(v, h))
+            if label is not None:
+                expected.append(label)
+                # Give the worker time to finish before the next sample
+                deadline = time.monotonic() + 5.0
+                while background._label is None and time.monotonic() < deadline:
+                    time.sleep(0.001)
+        got.append(background.predict(1500.0, config.EOG_BASELINE))
+
+        self.assertEqual([label for label in got if label is not None], expected)
+
+    def test_batch_features_match_per_window(self):
+        """Batch extraction should equal extract_dual_features row by row."""
+        rng = np.random.default_rng(7)
+        windows_v = rng.normal(1500, 50, (6, 200))
+        windows_v[2, 60:90] += 2000
+        windows_v[4] = 1500.0  # flat window: zero skewness/kurtosis
+        windows_h = rng.integers(1800, 2300, (6, 200)).astype(float)
+
+        batch = extract_dual_features_batch(windows_v, windows_h)
+        expected = [extract_dual_features(v, h) for v, h in zip(windows_v, windows_h)]
+        self.assertEqual(batch.shape, (6, len(DUAL_FEATURE_NAMES)))
+        np.testing.assert_allclose(batch, expected, rtol=1e-9, atol=1e-9)
+
+    def test_dual_features_fill_out_buffer(self):
+        """Passing out= should fill that buffer with the same features."""
+        rng = np.random.default_rng(3)
+        window_v = rng.normal(1500, 50, 200)
+        window_h = rng.normal(2048, 80, 200)
+
+        buf = np.full((1, len(DUAL_FEATURE_NAMES)), np.nan)
+        result = extract_dual_features(window_v, window_h, out=buf[0])
+        self.assertTrue(np.shares_memory(result, buf))
+        np.testing.assert_array_equal(
+            buf[0], np.concatenate([extract_features(window_v),
+                                    extract_features(window_h)]))
+
     @classmethod
     def tearDownClass(cls):
         """Clean up temporary model files."""
@@ -0,0 +1,87 @@
+"""
+Tests for serial line parsing.
+
+Feeds raw bytes through SerialReader.read_packet() and stream() with a
+fake port object, so no hardware or pyserial is needed.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eog_cursor.serial_reader import SerialReader
+from eog_cursor import config
+
+
+class _FakeSerial:
+    """Returns queued byte chunks from readline() or read()."""
+
+    is_open = True
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    @property
+    def in_waiting(self):
+        return len(self.chunks[0]) if self.chunks else 0
+
+    def readline(self):
+        return self.chunks.pop(0) if self.chunks else b""
+
+    def read(self, size=1):
+        if not self.chunks:
+            raise EOFError  # ends the stream() generator in tests
+        return self.chunks.pop(0)
+
+
+class TestReadPacket(unittest.TestCase):
+    """Test parsing of dual-channel, legacy, and malformed lines."""
+
+    def _read(self, *lines):
+        reader = SerialReader(port="fake")
+        reader.ser = _FakeSerial(lines)
+        return reader, [reader.read_packet() for _ in lines]
+
+    def test_dual_channel_line(self):
+        """Six fields should map to timestamp, both EOG channels and gyro."""
+        _, (packet,) = self._read(b"1234,2100,1900,-15,22,-3\r\n")
+        self.assertEqual(packet[:6], (1234, 2100, 1900, -15, 22, -3))
+        self.assertIsInstance(packet.pc_time, float)
+
+    def test_legacy_single_channel_line(self):
+        """Five fields should fill eog_h with the baseline."""
+        _, (packet,) = self._read(b"10,2500,1,2,3\n")
+        self.assertEqual(packet[:6], (10, 2500, config.EOG_BASELINE, 1, 2, 3))
+
+    def test_blank_and_malformed_lines(self):
+        """Blank lines are skipped silently; bad lines count as errors."""
+        reader, packets = self._read(b"\r\n", b"1,2,3\r\n", b"1,2,x,4,5,6\r\n", b"")
+        self.assertEqual(packets, [None, None, None, None])
+        self.assertEqual(reader._error_count, 2)
+
+
+class TestStream(unittest.TestCase):
+    """Test burst reading in stream()."""
+
+    def test_lines_split_across_reads(self):
+        """Packets should be reassembled across chunk boundaries, in order."""
+        reader = SerialReader(port="fake")
+        reader.ser = _FakeSerial([
+            b"1,2000,2001,1,2,3\r\n2,2002,20",
+            b"03,4,5,6\r\n\r\ngarbage\r\n3,2004,2005,7,8,9\r",
+            b"\n4,2006",
+        ])
+        packets = []
+        with self.assertRaises(EOFError):
+            for packet in reader.stream():
+                packets.append(packet[:6])
+        self.assertEqual(packets, [(1, 2000, 2001, 1, 2, 3),
+                                   (2, 2002, 2003, 4, 5, 6),
+                                   (3, 2004, 2005, 7, 8, 9)])
+        self.assertEqual(reader._error_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,8 +13,12 @@ import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from eog_cursor.signal_processing import EOGLowPassFilter, SlidingWindow, GyroKalmanFilter, GyroKalmanFilter3Axis
+from eog_cursor.signal_processing import (
+    EOGLowPassFilter, SlidingWindow, SensorRing, GyroCalibrator, GyroKalmanFilter, GyroKalmanFilter3Axis,
+)
+from eog_cursor.serial_reader import SensorPacket
 from eog_cursor.feature_extraction import extract_features, FEATURE_NAMES
+from eog_cursor._feature_loop import window_features
 from eog_cursor import config
 
 
@@ -60,6 +64,28 @@ class TestEOGLowPassFilter(unittest.TestCase):
         result = self.filt.filter_sample(2048.0)
         self.assertIsNotNone(result)
 
+    def test_filter_array_matches_per_sample(self):
+        """Block filtering should equal sample-by-sample filtering, including state carry."""
+        rng = np.random.default_rng(0)
+        signal = 2048 + rng.normal(0, 300, 500)
+        per_sample = [self.filt.filter_sample(s) for s in signal]
+
+        block = EOGLowPassFilter(cutoff=30, fs=200, order=4)
+        out = np.concatenate([block.filter_array(signal[:123]),
+                              block.filter_array(signal[123:])])
+        np.testing.assert_allclose(out, per_sample, rtol=1e-12)
+
+    def test_sample_and_array_share_state(self):
+        """Switching between filter_sample and filter_array should not reset state."""
+        rng = np.random.default_rng(1)
+        signal = 2048 + rng.normal(0, 300, 300)
+        reference = EOGLowPassFilter(cutoff=30, fs=200, order=4).filter_array(signal)
+
+        mixed = [self.filt.filter_sample(s) for s in signal[:100]]
+        mixed.extend(self.filt.filter_array(signal[100:200]))
+        mixed.extend(self.filt.filter_sample(s) for s in signal[200:])
+        np.testing.assert_allclose(mixed, reference, rtol=1e-12)
+
 
 class TestSlidingWindow(unittest.TestCase):
     """Test sliding window buffer."""
@@ -103,6 +129,57 @@ class TestSlidingWindow(unittest.TestCase):
         np.testing.assert_array_equal(win.get(), [0, 0, 0])
 
 
+class TestSensorRing(unittest.TestCase):
+    """Test multi-channel ring buffer."""
+
+    def test_becomes_full(self):
+        """Ring should report full after enough samples."""
+        ring = SensorRing(2, size=5)
+        for i in range(4):
+            ring.push(float(i), -float(i))
+        self.assertFalse(ring.is_full())
+        ring.push(4.0, -4.0)
+        self.assertTrue(ring.is_full())
+
+    def test_window_matches_sliding_window(self):
+        """Windows should equal SlidingWindow contents across wrap-around."""
+        ring = SensorRing(2, size=7)
+        win_a = SlidingWindow(size=7)
+        win_b = SlidingWindow(size=7)
+        for i in range(30):
+            ring.push(float(i), float(100 + i))
+            win_a.push(float(i))
+            win_b.push(float(100 + i))
+            window = ring.window()
+            self.assertEqual(window.shape, (2, 7))
+            np.testing.assert_array_equal(window[0], win_a.get())
+            np.testing.assert_array_equal(window[1], win_b.get())
+
+    def test_extend_matches_push(self):
+        """Block writes should leave the same ring as per-sample pushes."""
+        pushed = SensorRing(2, size=7)
+        extended = SensorRing(2, size=7)
+        i = 0
+        for n in (3, 5, 1, 7, 0, 16, 4):
+            block = np.arange(i, i + n, dtype=float)
+            for x in block:
+                pushed.push(x, -x)
+            extended.extend(block, -block)
+            i += n
+            self.assertEqual(extended.count, pushed.count)
+            self.assertEqual(extended.head, pushed.head)
+            np.testing.assert_array_equal(extended.buffer, pushed.buffer)
+
+    def test_reset(self):
+        """Reset should clear the ring."""
+        ring = SensorRing(1, size=3)
+        for i in range(5):
+            ring.push(float(i))
+        ring.reset()
+        self.assertFalse(ring.is_full())
+        np.testing.assert_array_equal(ring.window(), [[0, 0, 0]])
+
+
 class TestGyroKalmanFilter(unittest.TestCase):
     """Test Kalman filter for gyroscope bias tracking."""
 
@@ -169,6 +246,42 @@ class TestGyroKalmanFilter(unittest.TestCase):
         self.assertAlmostEqual(by, 200.0)
         self.assertAlmostEqual(bz, 300.0)
 
+    def test_3axis_update_array_matches_update(self):
+        """Column-wise update should equal per-sample updates, state included."""
+        rng = np.random.default_rng(4)
+        gx, gy, gz = (rng.integers(-3000, 3000, 300).tolist() for _ in range(3))
+        per_sample = GyroKalmanFilter3Axis()
+        per_sample.set_initial_bias(12.0, -7.0, 3.0)
+        batched = GyroKalmanFilter3Axis()
+        batched.set_initial_bias(12.0, -7.0, 3.0)
+
+        expected = [per_sample.update(x, y, z) for x, y, z in zip(gx, gy, gz)]
+        cx, cy, cz = batched.update_array(gx, gy, gz)
+        self.assertEqual(list(zip(cx, cy, cz)), expected)
+        self.assertEqual(batched.get_bias(), per_sample.get_bias())
+        self.assertEqual(batched.p_bias, per_sample.p_bias)
+
+    def test_calibrator_skips_discard_and_averages(self):
+        """Calibrator should drop the first samples and average the rest."""
+        class _Source:
+            def stream(self):
+                for i in range(100):
+                    g = 1000 if i < 5 else 10 + (i % 2)
+                    yield SensorPacket(i * 5, 2048, 2048, g, -g, 2 * g, 0.0)
+
+        cal = GyroCalibrator(num_samples=20, discard=5)
+        bx, by, bz = cal.calibrate(_Source())
+        self.assertAlmostEqual(bx, 10.5)
+        self.assertAlmostEqual(by, -10.5)
+        self.assertAlmostEqual(bz, 21.0)
+        self.assertTrue(cal.calibrated)
+
+        # Column-wise correction must round exactly like the per-sample path
+        g = np.arange(-40, 40)
+        cx, cy, cz = cal.correct_array(g, g, g)
+        expected = [cal.correct(v, v, v) for v in g.tolist()]
+        self.assertEqual(list(zip(cx.tolist(), cy.tolist(), cz.tolist())), expected)
+
 
 class TestFeatureExtraction(unittest.TestCase):
     """Test feature extraction from EOG windows."""
@@ -206,6 +319,41 @@ class TestFeatureExtraction(unittest.TestCase):
         features = extract_features(window)
         self.assertFalse(np.any(np.isnan(features)))
 
+    def test_matches_reference_definitions(self):
+        """Closed-form features should match the direct NumPy definitions."""
+        rng = np.random.default_rng(3)
+        window = rng.integers(1500, 2600, 200).astype(float)  # ADC-like, exact zeros after centering
+        centered = window - window.mean()
+        std = window.std()
+        expected = [
+            np.ptp(window),
+            np.sum(np.diff(np.sign(centered)) != 0),
+            np.polyfit(np.arange(len(window)), window, 1)[0],
+            np.max(np.abs(np.diff(window))),
+            window.mean(),
+            std,
+            np.mean((centered / std) ** 3),
+            np.mean((centered / std) ** 4) - 3,
+            np.sqrt(np.mean(window ** 2)),
+            np.var(np.diff(window)),
+        ]
+        np.testing.assert_allclose(extract_features(window), expected, rtol=1e-6, atol=1e-9)
+
+    def test_loop_form_matches(self):
+        """The compiled-build loop should give the same features, at any offset."""
+        rng = np.random.default_rng(8)
+        windows = [
+            rng.integers(1500, 2600, 200).astype(float),
+            np.r_[np.full(80, 1500.0), np.full(40, 3400.0), np.full(80, 1500.0)],
+            np.full(50, 2048.0),
+            np.array([2048.0]),
+        ]
+        for window in windows:
+            out = np.full(len(FEATURE_NAMES) + 3, np.nan)
+            window_features(window, out, 3)
+            np.testing.assert_allclose(out[3:], extract_features(window),
+                                       rtol=1e-9, atol=1e-9)
+
 
 class TestCursorControllers(unittest.TestCase):
     """Test cursor controller state logic (without actual mouse movement)."""
@@ -254,6 +402,125 @@ class TestCursorControllers(unittest.TestCase):
         self.assertLess(abs(state[1]), 1.0)
         self.assertLess(abs(state[3]), 1.0)
 
+    def test_cursor_move_is_pure(self):
+        """_compute_cursor_move should return (dx, dy) without touching the GUI."""
+        from eog_cursor.cursor_control import ThresholdController, StateSpaceController
+
+        tc = ThresholdController()
+        dx, dy = tc._compute_cursor_move(2000, 1000, any_action=False)
+        self.assertAlmostEqual(dx, 1000 * config.CURSOR_SENSITIVITY)
+        self.assertAlmostEqual(dy, 2000 * config.CURSOR_SENSITIVITY)
+        self.assertEqual(tc._compute_cursor_move(2000, 1000, any_action=True), (0.0, 0.0))
+
+        sc = StateSpaceController()
+        # First step only loads velocity; displacement follows on the next step
+        self.assertEqual(sc._compute_cursor_move(0, 1000, any_action=False), (0.0, 0.0))
+        dx, dy = sc._compute_cursor_move(0, 0, any_action=False)
+        self.assertAlmostEqual(dx, config.SS_DT * 1000 * config.SS_SENSITIVITY)
+        self.assertEqual(dy, 0.0)
+
+    def test_cursor_moves_coalesced(self):
+        """Sub-pixel moves should accumulate and flush at the coalescing interval."""
+        from eog_cursor import cursor_control
+
+        class FakeGui:
+            def __init__(self):
+                self.moves = []
+
+            def moveRel(self, dx, dy, _pause=True):
+                self.moves.append((dx, dy))
+
+        gui = FakeGui()
+        saved = cursor_control._pyautogui
+        cursor_control._pyautogui = gui
+        try:
+            tc = cursor_control.ThresholdController()
+            n = 200
+            for i in range(n):
+                # gy=150 → 1.5 px per sample at default sensitivity
+                tc.update(config.EOG_BASELINE, config.EOG_BASELINE, 0, 150, 0,
+                          now=10.0 + i * config.SAMPLE_PERIOD)
+        finally:
+            cursor_control._pyautogui = saved
+
+        self.assertLess(len(gui.moves), n / 2)
+        self.assertTrue(all(isinstance(dx, int) for dx, _ in gui.moves))
+        # Nothing is lost: sent pixels plus the unsent remainder equal the input
+        total = sum(dx for dx, _ in gui.moves) + tc._pending_dx
+        self.assertAlmostEqual(total, n * 150 * config.CURSOR_SENSITIVITY)
+
+    def test_action_pump_preserves_order_and_motion(self):
+        """Queued actions should run in order with merged moves summing correctly."""
+        import time
+        from eog_cursor.cursor_control import _ActionPump
+
+        class FakeGui:
+            def __init__(self):
+                self.calls = []
+
+            def moveRel(self, dx, dy, _pause=True):
+                self.calls.append(('moveRel', dx, dy))
+
+            def click(self, button='left', _pause=True):
+                self.calls.append(('click', button))
+
+        gui = FakeGui()
+        pump = _ActionPump(gui)
+        for _ in range(3):
+            pump.moveRel(2, -1)
+        pump.click(button='right')
+        pump.moveRel(5, 5)
+
+        deadline = time.monotonic() + 2.0
+        while (not gui.calls or gui.calls[-1] != ('moveRel', 5, 5)) and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        i = gui.calls.index(('click', 'right'))
+        before = gui.calls[:i]
+        self.assertEqual(sum(c[1] for c in before), 6)
+        self.assertEqual(sum(c[2] for c in before), -3)
+        self.assertEqual(gui.calls[i + 1:], [('moveRel', 5, 5)])
+
+    def test_hotkey_falls_back_to_pyautogui(self):
+        """Without an XTest sender, chords should go through gui.hotkey."""
+        from eog_cursor import cursor_control
+
+        class FakeGui:
+            def __init__(self):
+                self.hotkeys = []
+
+            def hotkey(self, *keys, _pause=True):
+                self.hotkeys.append(keys)
+
+        gui = FakeGui()
+        saved = cursor_control._x11_hotkey
+        cursor_control._x11_hotkey = None
+        try:
+            cursor_control._send_hotkey(gui, 'alt', 'left')
+        finally:
+            cursor_control._x11_hotkey = saved
+        self.assertEqual(gui.hotkeys, [('alt', 'left')])
+
+    def test_gaze_flags_scalar_matches_vectorized(self):
+        """gaze_flags should give the same answer per sample and per array."""
+        from eog_cursor.cursor_control import gaze_flags
+
+        eog_v = np.array([2048, 2900, 1000, 2048, 3500])
+        eog_h = np.array([2048, 2048, 2048, 1000, 2900])
+        gv, gh = gaze_flags(eog_v, eog_h)
+        for i in range(len(eog_v)):
+            sv, sh = gaze_flags(int(eog_v[i]), int(eog_h[i]))
+            self.assertEqual(bool(sv), bool(gv[i]))
+            self.assertEqual(bool(sh), bool(gh[i]))
+        self.assertEqual(gv.tolist(), [False, True, True, False, True])
+        self.assertEqual(gh.tolist(), [False, False, False, True, True])
+
+        # Exactly on a threshold is still inside the neutral band
+        edges = np.array([config.LOOK_DOWN_THRESHOLD, config.LOOK_UP_THRESHOLD,
+                          config.LOOK_DOWN_THRESHOLD - 1, config.LOOK_UP_THRESHOLD + 1])
+        gv, _ = gaze_flags(edges, edges)
+        self.assertEqual(gv.tolist(), [False, False, True, True])
+
 
 if __name__ == "__main__":
     unittest.main()
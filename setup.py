@@ -1,5 +1,34 @@
+import os
+
 from setuptools import setup, find_packages
 
+# Optional ahead-of-time compilation of the per-sample hot path.
+# `EOG_CURSOR_COMPILE=1 pip install .` compiles the event detectors,
+# controllers, serial line parser and window feature loop with Cython
+# (pure-Python mode, no .pyx sources needed); the compiled modules shadow
+# the .py files, so imports are unchanged.
+# event_detector.pxd makes the detectors extension types with C-typed
+# fields; signal_processing.pxd does the same for the per-packet low-pass
+# and gyro filters; _feature_loop.pxd types the feature loop, which
+# feature_extraction only uses once compiled; the controllers compile as
+# ordinary Python classes.  C types come only from the .pxd files:
+# annotation_typing is off because Cython would otherwise treat hints
+# such as `eog_v: int` as conversions and truncate filtered float samples.
+ext_modules = []
+if os.environ.get("EOG_CURSOR_COMPILE") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            "python/eog_cursor/event_detector.py",
+            "python/eog_cursor/cursor_control.py",
+            "python/eog_cursor/serial_reader.py",
+            "python/eog_cursor/signal_processing.py",
+            "python/eog_cursor/_feature_loop.py",
+        ],
+        compiler_directives={"language_level": "3", "annotation_typing": False},
+    )
+
 setup(
     name="eog-cursor-control",
     version="1.0.0",
@@ -8,6 +37,7 @@ setup(
     packages=find_packages(where="python"),
     package_dir={"": "python"},
     python_requires=">=3.10",
+    ext_modules=ext_modules,
     install_requires=[
         "pyserial>=3.5",
         "pyautogui>=0.9.54",